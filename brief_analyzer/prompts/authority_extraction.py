@@ -7,9 +7,10 @@ def build_prompt(brief_texts: dict[str, str]) -> str:
     Args:
         brief_texts: dict mapping filename -> text content for all .txt files
     """
-    file_listing = ""
-    for name, content in sorted(brief_texts.items()):
-        file_listing += f"\n\n--- BEGIN {name} ---\n{content}\n--- END {name} ---\n"
+    file_listing = "".join(
+        f"\n\n--- BEGIN {name} ---\n{content}\n--- END {name} ---\n"
+        for name, content in sorted(brief_texts.items())
+    )
 
     return f"""You are a legal research assistant analyzing Texas appellate briefs and related filings.
 
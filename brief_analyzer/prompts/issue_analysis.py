@@ -11,9 +11,10 @@ def build_prompt(
         brief_texts: dict mapping filename -> text content for all briefs
         citecheck_text: content of CITECHECK.md
     """
-    file_listing = ""
-    for name, content in sorted(brief_texts.items()):
-        file_listing += f"\n\n--- BEGIN {name} ---\n{content}\n--- END {name} ---\n"
+    file_listing = "".join(
+        f"\n\n--- BEGIN {name} ---\n{content}\n--- END {name} ---\n"
+        for name, content in sorted(brief_texts.items())
+    )
 
     return f"""You are a senior appellate attorney analyzing a Texas criminal appeal for moot court preparation. You have access to all briefs, the cite-check report, and the full text of all cited authorities in the authorities/ directory.
 
@@ -13,9 +13,10 @@ def build_prompt(
         issue_analysis_text: content of ISSUE_ANALYSIS.md
         citecheck_text: content of CITECHECK.md
     """
-    file_listing = ""
-    for name, content in sorted(brief_texts.items()):
-        file_listing += f"\n\n--- BEGIN {name} ---\n{content}\n--- END {name} ---\n"
+    file_listing = "".join(
+        f"\n\n--- BEGIN {name} ---\n{content}\n--- END {name} ---\n"
+        for name, content in sorted(brief_texts.items())
+    )
 
     return f"""You are a seasoned appellate judge preparing for oral argument in a Texas criminal appeal. You have read all the briefs, the issue analysis, the cite-check report, and all cited authorities (available in authorities/).
 
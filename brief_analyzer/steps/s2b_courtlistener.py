@@ -32,6 +32,19 @@ CITE_RE = re.compile(
 
 WL_CITE_RE = re.compile(r"(\d{4})\s+WL\s+(\d+)")
 
+# AUTHORITIES.md section headings: "## CASES" and "### [1. ]Case Name, Citation"
+CASES_HEADING_RE = re.compile(r"^##\s+CASES\s*$", re.IGNORECASE)
+CASE_HEADING_RE = re.compile(r"^###\s+(?:\d+\.\s+)?(.+)$")
+
+# Case name: everything before the first comma that precedes a number or
+# "No."; the fallback takes everything before the first comma
+CASE_NAME_RE = re.compile(r"(.+?),\s*(?:No\.|[0-9])")
+CASE_NAME_FALLBACK_RE = re.compile(r"(.+?),\s")
+
+# HTML tags, and runs of 3+ newlines (collapsed to one blank line)
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+BLANK_LINES_RE = re.compile(r"\n{3,}")
+
 # Minimum opinion text length to consider it usable
 MIN_TEXT_LENGTH = 200
 
@@ -153,7 +166,7 @@ def _parse_authorities_entries(text: str) -> list[dict]:
     for line in text.split("\n"):
         stripped = line.strip()
         # Look for the cases section header (handles ## CASES and ## Cases)
-        if re.match(r"^##\s+CASES\s*$", stripped, re.IGNORECASE):
+        if CASES_HEADING_RE.match(stripped):
             in_cases_section = True
             continue
         if stripped.startswith("## ") and in_cases_section:
@@ -164,7 +177,7 @@ def _parse_authorities_entries(text: str) -> list[dict]:
 
         # Match ### headings: ### Case Name, Citation
         # or **bold** entries: **Case Name, Citation**
-        heading_match = re.match(r"^###\s+(?:\d+\.\s+)?(.+)$", stripped)
+        heading_match = CASE_HEADING_RE.match(stripped)
         bold_match = CASE_ENTRY_RE.match(stripped)
 
         if heading_match:
@@ -195,11 +208,11 @@ def _parse_authorities_entries(text: str) -> list[dict]:
         }
 
         # Extract case name
-        name_match = re.match(r"(.+?),\s*(?:No\.|[0-9])", entry_text)
+        name_match = CASE_NAME_RE.match(entry_text)
         if name_match:
             info["case_name"] = name_match.group(1).strip()
         else:
-            name_match2 = re.match(r"(.+?),\s", entry_text)
+            name_match2 = CASE_NAME_FALLBACK_RE.match(entry_text)
             if name_match2:
                 info["case_name"] = name_match2.group(1).strip()
 
@@ -394,7 +407,7 @@ def _fetch_opinion_text(cluster_id: str, session: requests.Session) -> str:
 def _strip_html(html: str) -> str:
     """Remove HTML tags and decode common entities."""
     # Remove tags
-    text = re.sub(r"<[^>]+>", "", html)
+    text = HTML_TAG_RE.sub("", html)
     # Decode entities
     text = text.replace("&amp;", "&")
     text = text.replace("&lt;", "<")
@@ -403,7 +416,7 @@ def _strip_html(html: str) -> str:
     text = text.replace("&#39;", "'")
     text = text.replace("&nbsp;", " ")
     # Collapse whitespace
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
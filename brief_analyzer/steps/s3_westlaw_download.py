@@ -17,7 +17,7 @@ from pathlib import Path
 from urllib.parse import quote
 
 from ..config import ProjectConfig
-from ..utils.citation_parser import extract_ci_searches
+from ..utils.citation_parser import WL_CITE_RE, extract_ci_searches
 
 # CSS selectors -- isolated here for easy updating when Westlaw changes its UI.
 # Each uses comma-separated alternatives targeting data-testid, id, and aria-label.
@@ -145,6 +145,14 @@ _DOWNLOAD_EXTENSIONS = {".zip", ".rtf", ".RTF"}
 # Extensions that indicate an incomplete download
 _PARTIAL_EXTENSIONS = {".crdownload", ".part", ".tmp"}
 
+# Reporter citation in a CourtListener result or authority filename
+_HAVE_CITE_RE = re.compile(
+    r'(\d+)\s+'
+    r'(S\.W\.(?:2d|3d)|F\.(?:2d|3d|4th)|F\.\s*App\'x|F\.\s*Supp\.(?:\s*2d)?|'
+    r'U\.S\.|S\.\s*Ct\.|L\.\s*Ed\.(?:\s*2d)?)'
+    r'\s+(\d+)'
+)
+
 
 def _wait_for_user(prompt: str, download_dir: Path = None,
                    chromium_dl_dir: Path = None, timeout: int = 300):
@@ -564,32 +572,23 @@ def _get_downloaded_cites(results_path: Path, auth_dir: Path) -> set[str]:
         try:
             data = json.loads(results_path.read_text())
             for entry in data.get("found", []):
-                for m in re.finditer(
-                    r'(\d+)\s+'
-                    r'(S\.W\.(?:2d|3d)|F\.(?:2d|3d|4th)|F\.\s*App\'x|F\.\s*Supp\.(?:\s*2d)?|'
-                    r'U\.S\.|S\.\s*Ct\.|L\.\s*Ed\.(?:\s*2d)?)'
-                    r'\s+(\d+)',
-                    entry,
-                ):
+                for m in _HAVE_CITE_RE.finditer(entry):
                     have_cites.add(f"{m.group(1)} {m.group(2)} {m.group(3)}")
-                for m in re.finditer(r'(\d{4})\s+WL\s+(\d+)', entry):
-                    have_cites.add(f"{m.group(1)} WL {m.group(2)}")
+                if "WL" in entry:
+                    for m in WL_CITE_RE.finditer(entry):
+                        have_cites.add(f"{m.group(1)} WL {m.group(2)}")
         except (json.JSONDecodeError, KeyError):
             pass
 
     # From existing .txt files in authorities/
     for f in auth_dir.glob("*.txt"):
         fname = f.name
-        for m in re.finditer(
-            r'(\d+)\s+'
-            r'(S\.W\.(?:2d|3d)|F\.(?:2d|3d|4th)|F\.\s*App\'x|F\.\s*Supp\.(?:\s*2d)?|'
-            r'U\.S\.|S\.\s*Ct\.|L\.\s*Ed\.(?:\s*2d)?)'
-            r'\s+(\d+)',
-            fname,
-        ):
+        for m in _HAVE_CITE_RE.finditer(fname):
             have_cites.add(f"{m.group(1)} {m.group(2)} {m.group(3)}")
-        for m in re.finditer(r'(\d{4})\s+WL\s+(\d+)', fname):
-            have_cites.add(f"{m.group(1)} WL {m.group(2)}")
+        # Most filenames are reporter cites; check for the literal first
+        if "WL" in fname:
+            for m in WL_CITE_RE.finditer(fname):
+                have_cites.add(f"{m.group(1)} WL {m.group(2)}")
 
     return have_cites
 
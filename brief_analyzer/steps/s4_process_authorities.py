@@ -37,6 +37,29 @@ _RTF_INRE_REPORTED_RE = re.compile(
 )
 
 
+# RTF control words ("\\par ", "\\fs24") and group braces, stripped from header text
+_RTF_CONTROL_RE = re.compile(r'\\[a-z]+\d*\s?')
+_RTF_BRACE_RE = re.compile(r'[{}]')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Comma separating a case name from its cite: ", 123 ..." / ", No. ..." / ", __ ..."
+_NAME_CITE_SEP_RE = re.compile(r',\s+(?=\d|No\.|__)')
+_RTF_NAME_CITE_SEP_RE = re.compile(r',\s+(?=\d)')
+
+# Bold AUTHORITIES.md entries: **Full Citation**
+_BOLD_ENTRY_RE = re.compile(r'\*\*(.+?)\*\*')
+
+# Leading Westlaw download number in an RTF filename: "34 - "
+_RTF_NUMBER_PREFIX_RE = re.compile(r'^\d+\s*-\s*')
+
+# Reporter or WL cite in a candidate citation: "868 S.W.2d 337", "2019 WL 938276"
+_CANDIDATE_CITE_RE = re.compile(r'(\d+)\s+(S\.W\.(?:2d|3d)|U\.S\.|WL)\s+(\d+)')
+
+# Trailing parenthetical(s) of a full citation: "(Tex. App.—Austin 1993, no pet.)"
+_PARENTHETICAL_RE = re.compile(r'\s+(\([^)]+\)(?:\s*\([^)]+\))*)\s*$')
+
+
 def _parse_rtf_header_cite(rtf_path: Path) -> tuple[str, str] | None:
     """Extract case name and citation from the Westlaw RTF header.
 
@@ -53,11 +76,11 @@ def _parse_rtf_header_cite(rtf_path: Path) -> tuple[str, str] | None:
         m = pattern.search(content[:8000])
         if m:
             full_match = m.group(1)
-            name_cite = re.sub(r'\\[a-z]+\d*\s?', '', full_match)
-            name_cite = re.sub(r'[{}]', '', name_cite)
-            name_cite = re.sub(r'\s+', ' ', name_cite).strip()
+            name_cite = _RTF_CONTROL_RE.sub('', full_match)
+            name_cite = _RTF_BRACE_RE.sub('', name_cite)
+            name_cite = _WHITESPACE_RE.sub(' ', name_cite).strip()
 
-            parts = re.split(r',\s+(?=\d)', name_cite, maxsplit=1)
+            parts = _RTF_NAME_CITE_SEP_RE.split(name_cite, maxsplit=1)
             if len(parts) == 2:
                 return (parts[0].strip(), parts[1].strip())
 
@@ -76,7 +99,7 @@ def _parse_authorities_md(auth_md_path: Path) -> list[str]:
 
     text = auth_md_path.read_text(errors="replace")
     # Match **Full Citation** lines
-    citations = re.findall(r'\*\*(.+?)\*\*', text)
+    citations = _BOLD_ENTRY_RE.findall(text)
     # Filter to actual case citations (must contain "v." or "In re" or "Ex parte")
     return [c.strip() for c in citations
             if " v. " in c or "In re " in c or "Ex parte " in c]
@@ -85,14 +108,15 @@ def _parse_authorities_md(auth_md_path: Path) -> list[str]:
 def _normalize_name(name: str) -> str:
     """Normalize a case name for fuzzy matching.
 
-    Lowercases, strips punctuation, collapses whitespace.
+    Lowercases, strips punctuation, collapses whitespace. Called for every
+    (RTF, citation) pair, so it uses plain str methods rather than a chain
+    of regex substitutions.
     """
     s = name.lower()
     # Replace hyphens with spaces (so "luz-Torres" -> "luz torres", not "luztorres")
     s = s.replace('-', ' ')
-    s = re.sub(r'[.,\']', '', s)
-    s = re.sub(r'\s+', ' ', s).strip()
-    return s
+    s = s.replace('.', '').replace(',', '').replace("'", '')
+    return " ".join(s.split())
 
 
 def _extract_key_words(name: str) -> set[str]:
@@ -119,7 +143,7 @@ def _match_rtf_to_citation(rtf_path: Path, citations: list[str],
     """
     stem = rtf_path.stem
     # Strip leading number prefix: "34 - "
-    stem = re.sub(r'^\d+\s*-\s*', '', stem)
+    stem = _RTF_NUMBER_PREFIX_RE.sub('', stem)
     rtf_name = _normalize_name(stem)
     rtf_words = _extract_key_words(stem)
 
@@ -127,7 +151,7 @@ def _match_rtf_to_citation(rtf_path: Path, citations: list[str],
 
     for cite in citations:
         # Extract case name portion (before the first comma + digit/No./__/WL)
-        case_part = re.split(r',\s+(?:\d|No\.|__)', cite, maxsplit=1)[0]
+        case_part = _NAME_CITE_SEP_RE.split(cite, maxsplit=1)[0]
         cite_name = _normalize_name(case_part)
 
         # Exact match after normalization
@@ -210,7 +234,7 @@ def _match_rtf_to_citation(rtf_path: Path, citations: list[str],
         header = rtf_content[:5000]
         for cite, _ in candidates:
             # Extract reporter citation (e.g. "868 S.W.2d 337" or "2019 WL 938276")
-            cite_m = re.search(r'(\d+)\s+(S\.W\.(?:2d|3d)|U\.S\.|WL)\s+(\d+)', cite)
+            cite_m = _CANDIDATE_CITE_RE.search(cite)
             if cite_m:
                 cite_str = f"{cite_m.group(1)} {cite_m.group(2)} {cite_m.group(3)}"
                 if cite_str in header:
@@ -219,9 +243,9 @@ def _match_rtf_to_citation(rtf_path: Path, citations: list[str],
         # Looser match: reporter + page only (handles volume typos in briefs,
         # e.g. brief says "720 S.W.3d 282" but correct cite is "270 S.W.3d 282")
         for cite, _ in candidates:
-            cite_m = re.search(r'\d+\s+(S\.W\.(?:2d|3d)|U\.S\.|WL)\s+(\d+)', cite)
+            cite_m = _CANDIDATE_CITE_RE.search(cite)
             if cite_m:
-                page_pattern = f"{cite_m.group(1)} {cite_m.group(2)}"
+                page_pattern = f"{cite_m.group(2)} {cite_m.group(3)}"
                 if page_pattern in header:
                     return cite
 
@@ -236,7 +260,7 @@ def _split_citation(full_cite: str) -> tuple[str, str, str]:
     -> ("Gonzalez v. State", "720 S.W.3d 282", "(Tex. App.—Amarillo 2008, no pet.)")
     """
     # Find the first opening paren that's the parenthetical (not part of cite)
-    paren_m = re.search(r'\s+(\([^)]+\)(?:\s*\([^)]+\))*)\s*$', full_cite)
+    paren_m = _PARENTHETICAL_RE.search(full_cite)
     if paren_m:
         before_paren = full_cite[:paren_m.start()].strip()
         parenthetical = paren_m.group(1)
@@ -245,7 +269,7 @@ def _split_citation(full_cite: str) -> tuple[str, str, str]:
         parenthetical = ""
 
     # Split name from cite at first comma + digit/No./__
-    parts = re.split(r',\s+(?=\d|No\.|__)', before_paren, maxsplit=1)
+    parts = _NAME_CITE_SEP_RE.split(before_paren, maxsplit=1)
     if len(parts) == 2:
         return (parts[0].strip(), parts[1].strip(), parenthetical)
     return (before_paren, "", parenthetical)
@@ -270,7 +294,7 @@ def _check_cite_discrepancy(brief_cite: str, rtf_path: Path) -> str | None:
 
     # Normalize for comparison
     def norm(s):
-        return re.sub(r'\s+', ' ', s.lower().strip())
+        return _WHITESPACE_RE.sub(' ', s.lower().strip())
 
     name_matches = norm(rtf_name) == norm(brief_name)
     cite_matches = norm(rtf_cite) == norm(brief_cite_part)
@@ -381,7 +405,7 @@ def run(config: ProjectConfig):
                     renamed += 1
         else:
             # No AUTHORITIES.md match — use RTF filename
-            stem = re.sub(r'^\d+\s*-\s*', '', rtf_path.stem)
+            stem = _RTF_NUMBER_PREFIX_RE.sub('', rtf_path.stem)
             new_name = sanitize_filename(stem + ".txt")
             final_path = auth_dir / new_name
             unmatched.append(rtf_path.name)
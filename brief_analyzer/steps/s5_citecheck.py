@@ -8,7 +8,6 @@ Two-phase approach:
 
 import json
 import os
-import re
 import subprocess
 import sys
 from collections import defaultdict
@@ -78,8 +77,11 @@ def _claude_env():
 def _parse_json_array(text: str, label: str = "") -> list[dict]:
     """Extract a JSON array from text that may contain markdown fences or reasoning preamble."""
     # Strip markdown fences
-    text = re.sub(r"^```(?:json)?\s*\n?", "", text.strip())
-    text = re.sub(r"\n?```\s*$", "", text)
+    text = text.strip()
+    if text.startswith("```"):
+        text = text[3:].removeprefix("json").lstrip()
+    if text.endswith("```"):
+        text = text[:-3].rstrip()
 
     # Try direct parse first
     try:
@@ -191,7 +193,7 @@ def _find_authority_file(case_name: str, volume: str, reporter: str, page: str,
 
     # Try matching by case name (first party before "v.")
     if case_name:
-        first_party = case_name.split(" v.")[0].split(" v ")[0].strip()
+        first_party = case_name.partition(" v.")[0].partition(" v ")[0].strip()
         if first_party:
             first_lower = first_party.lower().split()[-1]
             for fname, text in auth_files.items():
@@ -336,18 +338,19 @@ def _group_by_authority(all_pairs: dict[str, list[dict]],
 
     Returns: {authority_filename: [proposition_dicts with brief_name added]}
     Pairs with no matching authority are collected under key None.
+    A brief cites the same authority many times, so each distinct
+    citation is looked up once.
     """
     grouped = defaultdict(list)
+    matches = {}  # (case_name, volume, reporter, page) -> _find_authority_file result
 
     for brief_name, pairs in all_pairs.items():
         for pair in pairs:
-            match = _find_authority_file(
-                pair.get("case_name", ""),
-                pair.get("volume", ""),
-                pair.get("reporter", ""),
-                pair.get("page", ""),
-                auth_files,
-            )
+            cite_key = (pair.get("case_name", ""), pair.get("volume", ""),
+                        pair.get("reporter", ""), pair.get("page", ""))
+            if cite_key not in matches:
+                matches[cite_key] = _find_authority_file(*cite_key, auth_files)
+            match = matches[cite_key]
             prop = dict(pair)
             prop["brief_name"] = brief_name
             if match:
@@ -664,14 +667,19 @@ def run(config: ProjectConfig):
             "quotation_accurate": None,
         }
 
-    # Format report per brief
+    # Format report per brief (bucket pairs by brief in one pass rather
+    # than rescanning every authority's propositions for each brief)
+    pairs_by_brief = defaultdict(list)
+    for props in grouped.values():
+        for p in props:
+            pairs_by_brief[p["brief_name"]].append(p)
+    for p in not_found:
+        pairs_by_brief[p["brief_name"]].append(p)
+
     sections = ["# Cite-Check Report\n"]
     for f in txt_files:
         brief_name = f.name
-        brief_pairs = []
-        for auth_file, props in grouped.items():
-            brief_pairs.extend(p for p in props if p["brief_name"] == brief_name)
-        brief_pairs.extend(p for p in not_found if p["brief_name"] == brief_name)
+        brief_pairs = pairs_by_brief.get(brief_name)
 
         if brief_pairs:
             report = _format_report(brief_name, brief_pairs)
@@ -31,6 +31,17 @@ CITE_RE = re.compile(
 
 WL_CITE_RE = re.compile(r"(\d{4})\s+WL\s+(\d+)")
 
+# Case name: everything before the first comma that precedes a number or
+# "No."; the fallback takes everything before the first comma
+CASE_NAME_RE = re.compile(r"(.+?),\s*(?:No\.|[0-9])")
+CASE_NAME_FALLBACK_RE = re.compile(r"(.+?),\s")
+
+# Docket number (e.g., "No. PD-0230-24", "No. 01-13-00994-CR")
+DOCKET_RE = re.compile(r"No\.\s+([\w-]+)")
+
+# Any "volume reporter page" cite, for reporters CITE_RE doesn't know
+RAW_CITE_RE = re.compile(r"\b(\d+\s+[A-Za-z][A-Za-z. ']+\s+\d+)\b")
+
 
 # Generic first parties that appear in many cases -- prefer second party for matching
 GENERIC_PARTIES = {
@@ -154,12 +165,12 @@ def _parse_authorities_md(text: str) -> list[dict]:
         }
 
         # Extract case name (everything before first comma that precedes a number)
-        name_match = re.match(r"(.+?),\s*(?:No\.|[0-9])", entry_text)
+        name_match = CASE_NAME_RE.match(entry_text)
         if name_match:
             current_case["case_name"] = name_match.group(1).strip()
         else:
             # Fallback: everything before the first number sequence
-            name_match2 = re.match(r"(.+?),\s", entry_text)
+            name_match2 = CASE_NAME_FALLBACK_RE.match(entry_text)
             if name_match2:
                 current_case["case_name"] = name_match2.group(1).strip()
 
@@ -173,14 +184,15 @@ def _parse_authorities_md(text: str) -> list[dict]:
             current_case["reporter"] = cite_m.group(2)
             current_case["page"] = cite_m.group(3)
 
-        # Extract WL citation
-        wl_m = WL_CITE_RE.search(entry_text)
+        # Extract WL citation (the literal check skips the regex for
+        # reporter-only entries)
+        wl_m = WL_CITE_RE.search(entry_text) if "WL" in entry_text else None
         if wl_m:
             current_case["wl_year"] = wl_m.group(1)
             current_case["wl_number"] = wl_m.group(2)
 
         # Extract docket number (e.g., "No. PD-0230-24", "No. 01-13-00994-CR")
-        docket_m = re.search(r"No\.\s+([\w-]+)", entry_text)
+        docket_m = DOCKET_RE.search(entry_text) if "No." in entry_text else None
         if docket_m:
             current_case["docket_number"] = docket_m.group(1)
 
@@ -189,7 +201,13 @@ def _parse_authorities_md(text: str) -> list[dict]:
     return cases
 
 
-def _match_authority(case: dict, auth_files: dict[str, str]) -> dict:
+def _lower_headers(auth_files: dict[str, str]) -> dict[str, str]:
+    """Lowercased first 2000 chars of each authority file, for name matching."""
+    return {fname: text[:2000].lower() for fname, text in auth_files.items()}
+
+
+def _match_authority(case: dict, auth_files: dict[str, str],
+                     headers: dict[str, str] | None = None) -> dict:
     """Try to match a case entry to an authority file.
 
     Returns dict with: status (found/uncertain/missing), file, match_method.
@@ -200,6 +218,9 @@ def _match_authority(case: dict, auth_files: dict[str, str]) -> dict:
       4. WL cite in full file content
       5. Both party names in filename (name-confirmed)
       6. Primary name in filename with single match (uncertain)
+
+    headers: _lower_headers(auth_files), built once by the caller so that
+    each file's header is not re-sliced and lowercased for every case.
     """
     volume = case["volume"]
     reporter = case["reporter"]
@@ -270,8 +291,7 @@ def _match_authority(case: dict, auth_files: dict[str, str]) -> dict:
     # For reporters not in our regex (S.W., Port., Hill, etc.), extract any
     # "volume reporter page" pattern from the entry and search file content.
     if not volume:
-        raw_cites = re.findall(r'\b(\d+\s+[A-Za-z][A-Za-z. \']+\s+\d+)\b',
-                               case["full_entry"])
+        raw_cites = RAW_CITE_RE.findall(case["full_entry"])
         for raw_cite in raw_cites:
             raw_cite = raw_cite.strip()
             if len(raw_cite) < 5:
@@ -287,16 +307,15 @@ def _match_authority(case: dict, auth_files: dict[str, str]) -> dict:
     # Uses prefix matching (min 4 chars) to handle common misspellings
     # like Gonzalez/Gonzales, Lightsey/Lightsy, etc.
     if match_names:
+        if headers is None:
+            headers = _lower_headers(auth_files)
         for name in match_names:
             if name in GENERIC_PARTIES:
                 continue
             # Use prefix (drop last 1-2 chars) to handle spelling variants
             prefix = name[:max(4, len(name) - 2)] if len(name) > 4 else name
-            content_name_hits = []
-            for fname, text in auth_files.items():
-                header = text[:2000].lower()
-                if prefix in header:
-                    content_name_hits.append(fname)
+            content_name_hits = [fname for fname, header in headers.items()
+                                 if prefix in header]
             if len(content_name_hits) == 1:
                 return {"status": "found", "file": content_name_hits[0],
                         "match_method": f"name_in_content ({name})"}
@@ -305,7 +324,7 @@ def _match_authority(case: dict, auth_files: dict[str, str]) -> dict:
                 if len(match_names) > 1:
                     other = [n for n in match_names if n != name and n not in GENERIC_PARTIES]
                     for oname in other:
-                        both = [f for f in content_name_hits if oname in auth_files[f][:2000].lower()]
+                        both = [f for f in content_name_hits if oname in headers[f]]
                         if len(both) == 1:
                             return {"status": "found", "file": both[0],
                                     "match_method": f"both_names_in_content ({name}, {oname})"}
@@ -409,6 +428,8 @@ def run(config: ProjectConfig):
     for f in txt_files:
         auth_files[f.name] = f.read_text(errors="replace")
 
+    headers = _lower_headers(auth_files)
+
     # Parse AUTHORITIES.md
     md_text = auth_md.read_text(errors="replace")
     cases = _parse_authorities_md(md_text)
@@ -424,7 +445,7 @@ def run(config: ProjectConfig):
     missing = []
 
     for case in cases:
-        result = _match_authority(case, auth_files)
+        result = _match_authority(case, auth_files, headers)
         result["case"] = case
         if result["status"] == "found":
             found.append(result)
@@ -486,9 +507,10 @@ def run(config: ProjectConfig):
         auth_files = {}
         for f in config.authorities_dir.glob("*.txt"):
             auth_files[f.name] = f.read_text(errors="replace")
+        headers = _lower_headers(auth_files)
         still_missing = []
         for r in missing:
-            result = _match_authority(r["case"], auth_files)
+            result = _match_authority(r["case"], auth_files, headers)
             if result["status"] == "missing":
                 still_missing.append(r)
             else:
@@ -50,6 +50,52 @@ WL_CITE_RE = re.compile(r"(?P<year>\d{4})\s+WL\s+(?P<number>\d+)")
 # Format: ci("845 S.W.2d 874" "810 S.W.2d 372" ...)
 CI_BLOCK_RE = re.compile(r'ci\(([^)]+)\)')
 
+# Case caption in an opinion header: "Party, Appellant v. Party"
+CAPTION_RE = re.compile(
+    r"^(.+?)\s*[,\n]\s*(?:Appellant|Appellee|Petitioner|Respondent|Plaintiff|Defendant)?"
+    r".*?\bv\.\s*(.+?)(?:\s*[,\n]|$)",
+    re.MULTILINE | re.IGNORECASE
+)
+
+# Reporter citation in an opinion header: 123 S.W.3d 456
+HEADER_CITE_RE = re.compile(r"(\d+)\s+(S\.W\.(?:2d|3d)|U\.S\.)\s+(\d+)")
+
+# Decision year: "Decided/Filed/Delivered ... 2016"
+DECISION_YEAR_RE = re.compile(r"(?:Decided|Filed|Delivered).*?(\d{4})")
+
+# Court name in an opinion header -> citation abbreviation (first match wins)
+COURT_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), abbrev) for pattern, abbrev in [
+        (r"Court\s+of\s+Criminal\s+Appeals", "Tex. Crim. App."),
+        (r"Supreme\s+Court\s+of\s+Texas", "Tex."),
+        (r"Court\s+of\s+Appeals.*?Houston.*?First", "Tex. App.--Houston [1st Dist.]"),
+        (r"Court\s+of\s+Appeals.*?Houston.*?Fourteenth", "Tex. App.--Houston [14th Dist.]"),
+        (r"Court\s+of\s+Appeals.*?Houston.*?14th", "Tex. App.--Houston [14th Dist.]"),
+        (r"Court\s+of\s+Appeals.*?Dallas", "Tex. App.--Dallas"),
+        (r"Court\s+of\s+Appeals.*?Fort\s+Worth", "Tex. App.--Fort Worth"),
+        (r"Court\s+of\s+Appeals.*?San\s+Antonio", "Tex. App.--San Antonio"),
+        (r"Court\s+of\s+Appeals.*?Austin", "Tex. App.--Austin"),
+        (r"Court\s+of\s+Appeals.*?Waco", "Tex. App.--Waco"),
+        (r"Court\s+of\s+Appeals.*?Amarillo", "Tex. App.--Amarillo"),
+        (r"Court\s+of\s+Appeals.*?El\s+Paso", "Tex. App.--El Paso"),
+        (r"Court\s+of\s+Appeals.*?Texarkana", "Tex. App.--Texarkana"),
+        (r"Court\s+of\s+Appeals.*?Beaumont", "Tex. App.--Beaumont"),
+        (r"Court\s+of\s+Appeals.*?Tyler", "Tex. App.--Tyler"),
+        (r"Court\s+of\s+Appeals.*?Eastland", "Tex. App.--Eastland"),
+        (r"Court\s+of\s+Appeals.*?Corpus\s+Christi", "Tex. App.--Corpus Christi"),
+        (r"Supreme\s+Court.*?United\s+States", "U.S."),
+    ]
+]
+
+# Subsequent history -> disposition parenthetical (first match wins)
+DISPOSITION_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), disp) for pattern, disp in [
+        (r"pet(?:ition)?\.?\s*ref(?:used)?'?d", "pet. ref'd"),
+        (r"no\s+pet(?:ition)?", "no pet."),
+        (r"cert\.\s*denied", "cert. denied"),
+    ]
+]
+
 
 def extract_ci_searches(text: str) -> list[str]:
     """Extract ci() search strings from AUTHORITIES.md content.
@@ -82,11 +128,7 @@ def parse_case_from_text(text: str) -> Optional[Citation]:
     header = text[:3000]
 
     # Find party names from "v." pattern
-    v_match = re.search(
-        r"^(.+?)\s*[,\n]\s*(?:Appellant|Appellee|Petitioner|Respondent|Plaintiff|Defendant)?"
-        r".*?\bv\.\s*(.+?)(?:\s*[,\n]|$)",
-        header, re.MULTILINE | re.IGNORECASE
-    )
+    v_match = CAPTION_RE.search(header)
     case_name = ""
     if v_match:
         p1 = v_match.group(1).strip().rstrip(",")
@@ -98,9 +140,7 @@ def parse_case_from_text(text: str) -> Optional[Citation]:
         case_name = f"{p1} v. {p2}"
 
     # Find reporter citation
-    cite_match = re.search(
-        r"(\d+)\s+(S\.W\.(?:2d|3d)|U\.S\.)\s+(\d+)", header
-    )
+    cite_match = HEADER_CITE_RE.search(header)
     volume, reporter, page = "", "", ""
     if cite_match:
         volume = cite_match.group(1)
@@ -115,34 +155,14 @@ def parse_case_from_text(text: str) -> Optional[Citation]:
 
     # Find court
     court = ""
-    court_patterns = [
-        (r"Court\s+of\s+Criminal\s+Appeals", "Tex. Crim. App."),
-        (r"Supreme\s+Court\s+of\s+Texas", "Tex."),
-        (r"Court\s+of\s+Appeals.*?Houston.*?First", "Tex. App.--Houston [1st Dist.]"),
-        (r"Court\s+of\s+Appeals.*?Houston.*?Fourteenth", "Tex. App.--Houston [14th Dist.]"),
-        (r"Court\s+of\s+Appeals.*?Houston.*?14th", "Tex. App.--Houston [14th Dist.]"),
-        (r"Court\s+of\s+Appeals.*?Dallas", "Tex. App.--Dallas"),
-        (r"Court\s+of\s+Appeals.*?Fort\s+Worth", "Tex. App.--Fort Worth"),
-        (r"Court\s+of\s+Appeals.*?San\s+Antonio", "Tex. App.--San Antonio"),
-        (r"Court\s+of\s+Appeals.*?Austin", "Tex. App.--Austin"),
-        (r"Court\s+of\s+Appeals.*?Waco", "Tex. App.--Waco"),
-        (r"Court\s+of\s+Appeals.*?Amarillo", "Tex. App.--Amarillo"),
-        (r"Court\s+of\s+Appeals.*?El\s+Paso", "Tex. App.--El Paso"),
-        (r"Court\s+of\s+Appeals.*?Texarkana", "Tex. App.--Texarkana"),
-        (r"Court\s+of\s+Appeals.*?Beaumont", "Tex. App.--Beaumont"),
-        (r"Court\s+of\s+Appeals.*?Tyler", "Tex. App.--Tyler"),
-        (r"Court\s+of\s+Appeals.*?Eastland", "Tex. App.--Eastland"),
-        (r"Court\s+of\s+Appeals.*?Corpus\s+Christi", "Tex. App.--Corpus Christi"),
-        (r"Supreme\s+Court.*?United\s+States", "U.S."),
-    ]
-    for pattern, abbrev in court_patterns:
-        if re.search(pattern, header, re.IGNORECASE):
+    for pattern, abbrev in COURT_PATTERNS:
+        if pattern.search(header):
             court = abbrev
             break
 
     # Find year from date
     year = ""
-    year_match = re.search(r"(?:Decided|Filed|Delivered).*?(\d{4})", header)
+    year_match = DECISION_YEAR_RE.search(header)
     if year_match:
         year = year_match.group(1)
     elif wl_match:
@@ -150,13 +170,8 @@ def parse_case_from_text(text: str) -> Optional[Citation]:
 
     # Find disposition
     disposition = ""
-    disp_patterns = [
-        (r"pet(?:ition)?\.?\s*ref(?:used)?'?d", "pet. ref'd"),
-        (r"no\s+pet(?:ition)?", "no pet."),
-        (r"cert\.\s*denied", "cert. denied"),
-    ]
-    for pattern, disp in disp_patterns:
-        if re.search(pattern, header, re.IGNORECASE):
+    for pattern, disp in DISPOSITION_PATTERNS:
+        if pattern.search(header):
             disposition = disp
             break
 
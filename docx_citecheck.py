@@ -21,18 +21,26 @@ folder as the .docx.
 """
 
 import argparse
+import bisect
+import functools
+import hashlib
 import json
 import os
+import random
 import re
+import signal
+import sqlite3
+import string
 import subprocess
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import xml.etree.ElementTree as ET
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
 from pathlib import Path
 
-import docx
-import fitz  # PyMuPDF
-
 
 # ---------------------------------------------------------------------------
 # Citation detection patterns
@@ -74,6 +82,10 @@ BARE_REPORTER_RE = re.compile(
     r'(\d+)\s+' + _REPORTERS + r'\s+(\d+)'
 )
 
+# Cheap gate for SHORT_CITE_RE / BARE_REPORTER_RE: every reporter
+# abbreviation starts with a capital letter right after "VOL "
+REPORTER_CITE_GATE_RE = re.compile(r'\d\s+[A-Z]')
+
 # Westlaw cite: YEAR WL NUMBER
 WL_CITE_RE = re.compile(r'\d{4}\s+WL\s+\d+')
 
@@ -86,12 +98,14 @@ CR_CITE_RE = re.compile(r'CR(?:\s*(?:at\s+))?:?\s*(\d+)')
 # State's Brief explicit page reference (handle curly apostrophe U+2019 and straight)
 STATE_BRIEF_RE = re.compile(r"State[\u2019']s\s+Br(?:ief|\.)\s+(?:at\s+)?(\d+(?:\s*[-\u2013]\s*\d+)?)", re.IGNORECASE)
 
-# Broader State's Brief reference — "The State argues/cites/concedes/claims..." or "State's argument/position"
+# Broader State's Brief reference — "The State argues/cites/concedes/claims..." or "State's argument/position".
+# Only used as a yes/no test, so the alternatives share a leading literal
+# "State" (and leave out "The"), which lets the engine skip ahead to it.
 STATE_ARGUES_RE = re.compile(
-    r"(?:"
-    r"(?:The\s+)?State\s+(?:argu|cit|conced|claim|acknowledg|assert|content|maintain|reli)"  # "The State argues"
-    r"|State[\u2019']s\s+(?:\w+\s+){0,3}(?:argu|cit|position|response|brief|claim|content)"  # "State's [adj] argument"
-    r"|State[\u2019']s\s+Br"  # "State's Br."
+    r"State(?:"
+    r"\s+(?:argu|cit|conced|claim|acknowledg|assert|content|maintain|reli)"  # "The State argues"
+    r"|[\u2019']s\s+(?:\w+\s+){0,3}(?:argu|cit|position|response|brief|claim|content)"  # "State's [adj] argument"
+    r"|[\u2019']s\s+Br"  # "State's Br."
     r")",
     re.IGNORECASE
 )
@@ -99,9 +113,52 @@ STATE_ARGUES_RE = re.compile(
 # Exhibit reference: SX{num} {timestamp}
 EXHIBIT_RE = re.compile(r'SX(\d+)\s+([\d:]+(?:\s*[-\u2013]\s*[\d:]+)?)')
 
+# Case name alone ("the court in Haywood v. State held"): the words
+# either side of "v."
+CASE_NAME_RE = re.compile(r"([A-Z][A-Za-z'\u2019\-]+)\s+v\.\s+([A-Z][A-Za-z'\u2019\-]+)")
+
+# A reporter or Westlaw cite, and how far past a case name to look for
+# one: a name followed by its cite is resolved by the cite, not the name
+NAME_CITE_RE = re.compile(rf"{BARE_REPORTER_RE.pattern}|{WL_CITE_RE.pattern}")
+NAME_CITE_WINDOW = 100
+
 # Id. or Id. at PAGE
 ID_CITE_RE = re.compile(r'\b[Ii]d\.\s*(?:at\s+(\d+))?')
 
+# Every extractable citation kind in one alternation, so a paragraph is
+# tokenized in a single pass (see scan_citations). Each named group wraps the
+# original pattern; that pattern's own groups follow the named group's index.
+CITATION_TOKEN_RE = re.compile("|".join(
+    f"(?P<{kind}>{pattern})" for kind, pattern in [
+        ("case_full", CASE_CITE_RE.pattern),
+        ("case_short", SHORT_CITE_RE.pattern),
+        ("wl", WL_CITE_RE.pattern),
+        ("rr", RR_CITE_RE.pattern),
+        ("cr", CR_CITE_RE.pattern),
+        ("exhibit", EXHIBIT_RE.pattern),
+        ("state_brief", f"(?i:{STATE_BRIEF_RE.pattern})"),
+        ("id", ID_CITE_RE.pattern),
+    ]
+))
+
+
+
+def _token_group_spans(pattern: re.Pattern) -> dict[str, tuple[int, int]]:
+    """Map each named group to the (first, last) indexes of the groups it wraps.
+
+    A named group wrapping a pattern with no groups of its own maps to
+    (index, index) so the whole match is used.
+    """
+    indexes = sorted(pattern.groupindex.values()) + [pattern.groups + 1]
+    spans = {}
+    for name, index in pattern.groupindex.items():
+        following = indexes[indexes.index(index) + 1]
+        spans[name] = (index + 1, following - 1) if following - index > 1 else (index, index)
+    return spans
+
+
+_TOKEN_GROUP_SPANS = _token_group_spans(CITATION_TOKEN_RE)
+
 
 def _clean_for_cite_match(text: str) -> str:
     """Strip formatting artifacts that interfere with citation matching."""
@@ -109,20 +166,42 @@ def _clean_for_cite_match(text: str) -> str:
     return text.replace("*", "")
 
 
-def has_citation(text: str) -> bool:
-    """Return True if the paragraph contains any checkable citation."""
+def _has_state(text_lower: str) -> bool:
+    """Literal gate for STATE_BRIEF_RE / STATE_ARGUES_RE, which both need "state"."""
+    return "state" in text_lower
+
+
+def _has_digit(text: str) -> bool:
+    """Literal gate for REPORTER_CITE_GATE_RE; ten memchr scans beat one regex \\d scan."""
+    return any(digit in text for digit in "0123456789")
+
+
+def has_citation(text: str, tokens: list[tuple[str, tuple]] | None = None) -> bool:
+    """Return True if the paragraph contains any checkable citation.
+
+    Each regex is gated behind a literal its pattern cannot match without,
+    so the common no-citation paragraph costs a few substring scans.
+    tokens: the paragraph's scan_citations result, if already computed;
+    only the patterns outside CITATION_TOKEN_RE are then re-checked.
+    """
     t = _clean_for_cite_match(text)
+    low = t.lower()
+    if tokens is not None:
+        return bool(
+            tokens
+            or (_has_digit(t) and REPORTER_CITE_GATE_RE.search(t) and BARE_REPORTER_RE.search(t))
+            or (_has_state(low) and STATE_ARGUES_RE.search(t))
+        )
     return bool(
-        CASE_CITE_RE.search(t)
-        or SHORT_CITE_RE.search(t)
-        or BARE_REPORTER_RE.search(t)
-        or WL_CITE_RE.search(t)
-        or RR_CITE_RE.search(t)
-        or CR_CITE_RE.search(t)
-        or STATE_BRIEF_RE.search(t)
-        or STATE_ARGUES_RE.search(t)
-        or EXHIBIT_RE.search(t)
-        or ID_CITE_RE.search(t)
+        ("v." in t and CASE_CITE_RE.search(t))
+        or (_has_digit(t) and REPORTER_CITE_GATE_RE.search(t)
+            and (SHORT_CITE_RE.search(t) or BARE_REPORTER_RE.search(t)))
+        or ("WL" in t and WL_CITE_RE.search(t))
+        or ("RR" in t and RR_CITE_RE.search(t))
+        or ("CR" in t and CR_CITE_RE.search(t))
+        or (_has_state(low) and (STATE_BRIEF_RE.search(t) or STATE_ARGUES_RE.search(t)))
+        or ("SX" in t and EXHIBIT_RE.search(t))
+        or ("id." in low and ID_CITE_RE.search(t))
     )
 
 
@@ -146,6 +225,11 @@ def build_id_map(paragraphs: list[tuple[int, str]]) -> dict[int, dict]:
 
     for idx, text in paragraphs:
         clean = _clean_for_cite_match(text)
+        # Every cite pattern below needs "VOL Reporter" and ID_CITE_RE needs
+        # "id."; a paragraph with neither leaves last_cite as it was
+        if not (_has_digit(clean) and REPORTER_CITE_GATE_RE.search(clean)) \
+                and "id." not in clean.lower():
+            continue
 
         # Collect all cite positions in this paragraph
         # Each entry: (position, {case_name, volume, reporter, page})
@@ -207,6 +291,22 @@ def build_id_map(paragraphs: list[tuple[int, str]]) -> dict[int, dict]:
 
 GLOBAL_AUTHORITIES_DIR = Path.home() / "Appeals" / "authorities_global"
 
+# Helpers below run once per authority file or once per prompt, so their
+# patterns are compiled here rather than looked up in re's cache per call.
+
+# Westlaw inline page marker: *NNN
+PAGE_MARKER_RE = re.compile(r'\*(\d{2,})(?=\s|$)')
+
+# Any "VOL Reporter PAGE" shape in a filename stem
+FILENAME_CITE_RE = re.compile(r'(\d+)\s+([A-Za-z].+?)\s+(\d+)(?!\w)')
+
+DOT_SPACE_RE = re.compile(r'\.\s+')
+
+# Filename decorations: number prefixes, macOS dup suffixes, KeyCite flags
+NUMBER_PREFIX_RE = re.compile(r'^[a-zA-Z]*\d+\s*-\s*')
+DUP_SUFFIX_RE = re.compile(r'\s*\(\d+\)\s*$')
+KEYCITE_FLAG_RE = re.compile(r'[\U0001f7e0-\U0001f7ff\U0001f3f4\U000e0000-\U000e007f\U0001f534]+$')
+
 
 def segment_by_pages(text: str) -> str:
     """Replace inline *NNN page markers with clear [PAGE NNN] headers.
@@ -215,7 +315,7 @@ def segment_by_pages(text: str) -> str:
     This converts them to explicit headers so the model can easily determine
     which page a passage falls on for pin cite verification.
     """
-    return re.sub(r'\*(\d{2,})(?=\s|$)', r'\n\n[PAGE \1]\n', text)
+    return PAGE_MARKER_RE.sub(r'\n\n[PAGE \1]\n', text)
 
 
 def _extract_reporter_cite(text: str) -> str | None:
@@ -224,7 +324,7 @@ def _extract_reporter_cite(text: str) -> str | None:
     Returns a normalized lowercase string like '666 s.w.3d 735' or None.
     Matches any reporter abbreviation (contains a period or is 'WL').
     """
-    for m in re.finditer(r'(\d+)\s+([A-Za-z].+?)\s+(\d+)(?!\w)', text):
+    for m in FILENAME_CITE_RE.finditer(text):
         reporter = m.group(2)
         if (len(reporter) <= 25
                 and ('.' in reporter or reporter.upper() == 'WL')
@@ -235,19 +335,19 @@ def _extract_reporter_cite(text: str) -> str | None:
 
 def _norm_cite(s: str) -> str:
     """Normalize a citation for matching: lowercase, collapse spaces after dots."""
-    s = re.sub(r'\s+', ' ', s.lower().strip())
-    s = re.sub(r'\.\s+', '.', s)
+    s = " ".join(s.lower().split())
+    s = DOT_SPACE_RE.sub('.', s)
     return s
 
 
 def _strip_filename_decorations(name: str) -> str:
     """Strip emoji flags, number prefixes, and macOS dup suffixes from a filename stem."""
     # Strip leading number prefixes like "01 - ", "s501 - "
-    clean = re.sub(r'^[a-zA-Z]*\d+\s*-\s*', '', name).strip()
+    clean = NUMBER_PREFIX_RE.sub('', name).strip()
     # Strip macOS duplicate suffix like "(2)"
-    clean = re.sub(r'\s*\(\d+\)\s*$', '', clean)
+    clean = DUP_SUFFIX_RE.sub('', clean)
     # Strip trailing KeyCite flag emoji (🟥 🟨 🟢 🔴 and tag sequences)
-    clean = re.sub(r'[\U0001f7e0-\U0001f7ff\U0001f3f4\U000e0000-\U000e007f\U0001f534]+$', '', clean).rstrip()
+    clean = KEYCITE_FLAG_RE.sub('', clean).rstrip()
     return clean
 
 
@@ -267,7 +367,7 @@ def _read_authority_text(path: Path) -> str | None:
             except Exception:
                 return None
         try:
-            result = subprocess.run(
+            subprocess.run(
                 ["textutil", "-convert", "txt", str(path), "-output", str(txt_sibling)],
                 capture_output=True, check=True, timeout=30,
             )
@@ -282,18 +382,65 @@ def _read_authority_text(path: Path) -> str | None:
                 return txt_sibling.read_text(errors="replace")
             except Exception:
                 pass
-        # Fallback: extract via pdftotext
+        # Fallback: extract in-process with PyMuPDF (also used for the page
+        # map) instead of starting a pdftotext process per file.
+        # Pages are separated by form feeds, as pdftotext separates them.
         try:
-            result = subprocess.run(
-                ["pdftotext", str(path), "-"],
-                capture_output=True, text=True, check=True, timeout=30,
-            )
-            return result.stdout
+            import fitz  # PyMuPDF
+            doc = fitz.open(str(path))
+            try:
+                return "\f".join(page.get_text() for page in doc)
+            finally:
+                doc.close()
         except Exception:
             return None
     return None
 
 
+# How much of an authority's text counts as its header (caption + cites)
+AUTHORITY_HEADER_CHARS = 3000
+
+
+def _read_authority_header(path: Path) -> str | None:
+    """Read just the first AUTHORITY_HEADER_CHARS of a plain-text authority.
+
+    Returns None when the header can't be taken from a .txt file on disk
+    (e.g. a PDF with no .txt sibling), so the caller falls back to the
+    full text.
+    """
+    if path.suffix.lower() != '.txt':
+        path = path.with_suffix('.txt')
+        if not path.exists():
+            return None
+    try:
+        with open(path, errors="replace") as f:
+            return f.read(AUTHORITY_HEADER_CHARS)
+    except Exception:
+        return None
+
+
+def _authority_header(auth_files: dict[str, str], fname: str) -> tuple[str, str]:
+    """Return (header, normalized header), cached when auth_files is lazy."""
+    if isinstance(auth_files, LazyAuthorities):
+        return auth_files.header(fname)
+    header = auth_files[fname][:AUTHORITY_HEADER_CHARS]
+    return header, _norm_cite(header)
+
+
+def _name_forms(fname: str) -> tuple[str, str, str, str]:
+    """Return (name, lowercase, no spaces, no spaces or periods) for a filename."""
+    lower = fname.lower()
+    compact = lower.replace(" ", "")
+    return fname, lower, compact, compact.replace(".", "")
+
+
+def _authority_name_forms(auth_files: dict[str, str]) -> list[tuple[str, str, str, str]]:
+    """Return _name_forms() for every authority, cached when auth_files is lazy."""
+    if isinstance(auth_files, LazyAuthorities):
+        return auth_files.name_forms()
+    return [_name_forms(fname) for fname in auth_files]
+
+
 class LazyAuthorities(dict):
     """Dict-like mapping of {display_name: text} with lazy text loading.
 
@@ -305,10 +452,13 @@ class LazyAuthorities(dict):
         super().__init__()
         self._paths: dict[str, Path] = {}  # clean_stem -> best file path
         self._cache: dict[str, str] = {}   # clean_stem -> loaded text
+        self._headers: dict[str, tuple[str, str]] = {}  # clean_stem -> (header, normalized)
+        self._name_forms: list[tuple[str, str, str, str]] | None = None
 
     def register(self, clean_stem: str, path: Path):
         """Register a file path for a cleaned stem (no text loading)."""
         self._paths[clean_stem] = path
+        self._name_forms = None
         # Insert a sentinel so len(), __contains__, keys(), iteration work
         super().__setitem__(clean_stem, None)
 
@@ -325,6 +475,48 @@ class LazyAuthorities(dict):
             return ""
         raise KeyError(key)
 
+    def header(self, key: str) -> tuple[str, str]:
+        """Return (header, normalized header) for an authority, computed once.
+
+        find_authority's content-header pass checks every authority for
+        each unresolved cite, so the normalization is cached per run.
+        Only the leading characters are read from disk when possible.
+        """
+        if key not in self._headers:
+            header = None
+            if key not in self._cache and key in self._paths:
+                # Read only the header, leaving the full text undecoded
+                # until the authority is actually matched
+                header = _read_authority_header(self._paths[key])
+            if header is None:
+                header = self[key][:AUTHORITY_HEADER_CHARS]
+            self._headers[key] = (header, _norm_cite(header))
+        return self._headers[key]
+
+    def name_forms(self) -> list[tuple[str, str, str, str]]:
+        """Return _name_forms() for every authority, computed once.
+
+        find_authority's filename passes scan every name for each cite the
+        index misses; lowering and stripping them per scan dominated lookup.
+        """
+        if self._name_forms is None:
+            self._name_forms = [_name_forms(fname) for fname in self._paths]
+        return self._name_forms
+
+    def prefetch(self, keys, workers: int = 8):
+        """Load the text of several authorities at once.
+
+        RTF authorities without a .txt sibling are converted by a
+        subprocess, so reading them on a thread pool overlaps the waits.
+        """
+        todo = [key for key in keys if key in self._paths and key not in self._cache]
+        if not todo:
+            return
+        with ThreadPoolExecutor(max_workers=min(workers, len(todo))) as executor:
+            for key, text in zip(todo, executor.map(
+                    lambda key: _read_authority_text(self._paths[key]), todo)):
+                self._cache[key] = text or ""
+
     def __contains__(self, key) -> bool:
         return key in self._paths
 
@@ -372,20 +564,23 @@ def load_authorities(auth_dir: Path) -> LazyAuthorities:
         search_dirs.append(GLOBAL_AUTHORITIES_DIR)
 
     for dir_idx, search_dir in enumerate(search_dirs):
-        for ext in ("*.txt", "*.rtf", "*.pdf"):
-            for path in sorted(search_dir.rglob(ext)):
-                if path.name.startswith("-") or path.name.startswith("."):
-                    continue
-                stem = path.stem
-                clean = _strip_filename_decorations(stem)
-                if not clean:
-                    continue
-                priority = EXT_PRIORITY.get(path.suffix.lower(), 9)
-                # Add directory penalty: local=0, global=100
-                priority += dir_idx * 100
-                key = clean
-                if key not in best_files or priority < best_files[key][1]:
-                    best_files[key] = (path, priority)
+        # One walk per directory (the global authorities tree can be large),
+        # visiting .txt, then .rtf, then .pdf files as separate globs would
+        paths = [path for path in search_dir.rglob("*") if path.suffix in EXT_PRIORITY]
+        paths.sort(key=lambda path: (EXT_PRIORITY[path.suffix], path))
+        for path in paths:
+            if path.name.startswith("-") or path.name.startswith("."):
+                continue
+            stem = path.stem
+            clean = _strip_filename_decorations(stem)
+            if not clean:
+                continue
+            priority = EXT_PRIORITY[path.suffix]
+            # Add directory penalty: local=0, global=100
+            priority += dir_idx * 100
+            key = clean
+            if key not in best_files or priority < best_files[key][1]:
+                best_files[key] = (path, priority)
 
     # Build lazy dict — register all paths without loading text
     auth_files = LazyAuthorities()
@@ -411,6 +606,10 @@ def build_cite_index(auth_files: LazyAuthorities | dict) -> dict[str, str]:
     return index
 
 
+# Party names too common to identify an authority by
+GENERIC_PARTY_WORDS = ("state", "the", "united", "states", "people", "com.")
+
+
 def find_authority(case_name: str, volume: str, reporter: str, page: str,
                    auth_files: dict[str, str],
                    cite_index: dict[str, str] | None = None) -> tuple[str, str] | None:
@@ -449,179 +648,237 @@ def find_authority(case_name: str, volume: str, reporter: str, page: str,
 
     # Pass 2: Space-stripped substring match in filenames
     cite_no_spaces = cite_pattern.replace(" ", "").lower()
-    for fname, text in auth_files.items():
-        if cite_no_spaces in fname.replace(" ", "").lower():
-            return (fname, text)
+    name_forms = _authority_name_forms(auth_files)
+    for fname, _, compact, _ in name_forms:
+        if cite_no_spaces in compact:
+            return (fname, auth_files[fname])
 
     # Pass 3: Loose filename match — volume + page + reporter abbreviation
     if volume and page:
         rep_short = reporter.replace(".", "").replace(" ", "").lower()
-        for fname, text in auth_files.items():
-            if volume in fname and page in fname:
-                fname_clean = fname.replace(".", "").replace(" ", "").lower()
-                if rep_short in fname_clean:
-                    return (fname, text)
+        for fname, _, _, fname_clean in name_forms:
+            if volume in fname and page in fname and rep_short in fname_clean:
+                return (fname, auth_files[fname])
 
-    # Pass 4: Case name + volume or page
+    # Last word of the first party ("Smith" in "John Smith v. State"),
+    # used by passes 4 and 6
+    last_word = ""
     if case_name:
-        first_party = case_name.split(" v.")[0].split(" v ")[0].strip()
+        first_party = case_name.partition(" v.")[0].partition(" v ")[0].strip()
         last_word = first_party.split()[-1].lower() if first_party else ""
-        if last_word and last_word not in ("state", "the", "united", "states", "people", "com."):
-            for fname, text in auth_files.items():
-                if last_word in fname.lower() and (volume in fname or page in fname):
-                    return (fname, text)
+
+    # Pass 4: Case name + volume or page
+    if last_word and last_word not in GENERIC_PARTY_WORDS:
+        for fname, lower, _, _ in name_forms:
+            if last_word in lower and (volume in fname or page in fname):
+                return (fname, auth_files[fname])
 
     # Pass 5: Match in file content header
-    for fname, text in auth_files.items():
-        header = text[:3000]
-        if volume and reporter and page:
-            if f"{volume} {reporter} {page}" in header:
-                return (fname, text)
+    if volume and reporter and page:
+        exact_cite = f"{volume} {reporter} {page}"
+        norm_pattern = _norm_cite(cite_pattern)
+        for fname in auth_files:
+            header, norm_header = _authority_header(auth_files, fname)
+            if exact_cite in header:
+                return (fname, auth_files[fname])
             # Also try normalized match in header
-            norm_header = _norm_cite(header)
-            if _norm_cite(cite_pattern) in norm_header:
-                return (fname, text)
+            if norm_pattern in norm_header:
+                return (fname, auth_files[fname])
 
     # Pass 6: Last resort — case name alone (for parallel citations)
-    if case_name:
-        first_party = case_name.split(" v.")[0].split(" v ")[0].strip()
-        last_word = first_party.split()[-1].lower() if first_party else ""
-        if last_word and len(last_word) > 3 and last_word not in ("state", "the", "united", "states", "people", "com."):
-            for fname, text in auth_files.items():
-                if last_word in fname.lower():
-                    return (fname, text)
+    if last_word and len(last_word) > 3 and last_word not in GENERIC_PARTY_WORDS:
+        for fname, lower, _, _ in name_forms:
+            if last_word in lower:
+                return (fname, auth_files[fname])
 
     return None
 
 
-def extract_case_cites(text: str) -> list[dict]:
-    """Extract all case citations from a paragraph."""
-    text = _clean_for_cite_match(text)
-    cites = []
-    seen = set()
-
-    # Full citations: Name v. Name, VOL Reporter PAGE
-    for m in CASE_CITE_RE.finditer(text):
-        name = m.group(1).strip()
-        vol = m.group(2)
-        rep = m.group(3)
-        pg = m.group(4)
-        key = f"{vol}_{rep}_{pg}"
-        if key not in seen:
-            seen.add(key)
-            cites.append({
-                "case_name": name,
-                "volume": vol,
-                "reporter": rep,
-                "page": pg,
-                "type": "case",
-            })
-
-    # Short-form citations: Name, VOL Reporter at PAGE
-    for m in SHORT_CITE_RE.finditer(text):
-        name = m.group(1).strip()
-        vol = m.group(2)
-        rep = m.group(3)
-        pg = m.group(4)
-        key = f"{vol}_{rep}_{pg}"
-        if key not in seen:
-            seen.add(key)
-            cites.append({
-                "case_name": name,
-                "volume": vol,
-                "reporter": rep,
-                "page": pg,
-                "type": "case",
-            })
-
-    # Westlaw citations
-    for m in WL_CITE_RE.finditer(text):
-        wl = m.group(0)
-        if wl not in seen:
-            seen.add(wl)
-            cites.append({
-                "case_name": "",
-                "volume": "",
-                "reporter": "WL",
-                "page": wl.split("WL")[1].strip(),
-                "type": "case",
-            })
+@functools.lru_cache(maxsize=None)
+def _party_word_re(word: str) -> re.Pattern:
+    """Compile (once per word) a whole-word pattern for a party name."""
+    return re.compile(rf"\b{re.escape(word)}\b")
+
+
+def find_authority_by_name(first_party: str, second_party: str,
+                           auth_files: dict[str, str]) -> tuple[str, str] | None:
+    """Find the one authority whose filename names both parties.
+
+    For cases a paragraph names without a reporter cite. Both party words
+    must appear whole in the filename, so "Johnson v. State" never matches
+    "Johnson v. Smith". With no distinctive party (both generic, as in
+    "State v. State"), or more than one filename matching, returns None
+    rather than guess.
+    """
+    words = [first_party.lower(), second_party.lower()]
+    if all(w in GENERIC_PARTY_WORDS for w in words):
+        return None
+    word_res = [_party_word_re(w) for w in words]
+    matches = [fname for fname, lower, _, _ in _authority_name_forms(auth_files)
+               if all(r.search(lower) for r in word_res)]
+    if len(matches) != 1:
+        return None
+    return (matches[0], auth_files[matches[0]])
+
+
+def scan_citations(clean_text: str) -> list[tuple[str, tuple]]:
+    """Tokenize a cleaned paragraph into citations in one regex pass.
 
+    Returns [(kind, groups), ...] in document order, where kind is a
+    CITATION_TOKEN_RE group name and groups holds the original pattern's
+    capture groups (the whole match for patterns without groups).
+    """
+    tokens = []
+    for m in CITATION_TOKEN_RE.finditer(clean_text):
+        kind = m.lastgroup
+        first, last = _TOKEN_GROUP_SPANS[kind]
+        tokens.append((kind, m.groups()[first - 1:last]))
+    return tokens
+
+
+def _case_cites_from_scan(tokens: list[tuple[str, tuple]]) -> list[dict]:
+    """Build case cite dicts from scan_citations output, in document order.
+
+    Deduplicates by (volume, reporter, page); Westlaw cites by WL number
+    alone, so "Smith v. State, 2014 WL 123" and a bare "2014 WL 123" are
+    one citation, which keeps the case name whichever comes first.
+    """
+    cites = []
+    seen = {}  # key -> index in cites
+    for kind, groups in tokens:
+        if kind == "wl":
+            name, vol, rep = "", "", "WL"
+            pg = groups[0].partition("WL")[2].strip()
+        elif kind in ("case_full", "case_short"):
+            name, vol, rep, pg = groups[0].strip(), groups[1], groups[2], groups[3]
+        else:
+            continue
+        key = ("WL", pg) if rep == "WL" else (vol, rep, pg)
+        if key in seen:
+            earlier = cites[seen[key]]
+            if name and not earlier["case_name"]:
+                earlier.update(case_name=name, volume=vol)
+            continue
+        seen[key] = len(cites)
+        cites.append({
+            "case_name": name,
+            "volume": vol,
+            "reporter": rep,
+            "page": pg,
+            "type": "case",
+        })
     return cites
 
 
-def extract_record_refs(text: str) -> list[dict]:
-    """Extract record references from a paragraph."""
-    text = _clean_for_cite_match(text)
-    refs = []
-    for m in RR_CITE_RE.finditer(text):
-        refs.append({"type": "rr", "volume": int(m.group(1)), "page": int(m.group(2))})
-    for m in CR_CITE_RE.finditer(text):
-        refs.append({"type": "cr", "page": int(m.group(1))})
-    for m in EXHIBIT_RE.finditer(text):
-        refs.append({"type": "exhibit", "number": m.group(1), "timestamp": m.group(2)})
+@dataclass
+class RecordRefs:
+    """Record references in a paragraph, one flat list per kind."""
+    rr: list[tuple[int, int]] = field(default_factory=list)          # (volume, page)
+    cr: list[int] = field(default_factory=list)                      # page
+    exhibits: list[tuple[str, str]] = field(default_factory=list)    # (number, timestamp)
+
+    def __bool__(self) -> bool:
+        return bool(self.rr or self.cr or self.exhibits)
+
+
+def _record_refs_from_scan(tokens: list[tuple[str, tuple]]) -> RecordRefs:
+    """Build RecordRefs (RR, CR, exhibits) from scan_citations output."""
+    refs = RecordRefs()
+    for kind, groups in tokens:
+        if kind == "rr":
+            refs.rr.append((int(groups[0]), int(groups[1])))
+        elif kind == "cr":
+            refs.cr.append(int(groups[0]))
+        elif kind == "exhibit":
+            refs.exhibits.append((groups[0], groups[1]))
     return refs
 
 
+def _state_brief_refs_from_scan(tokens: list[tuple[str, tuple]]) -> list[dict]:
+    """Build State's Brief page references from scan_citations output."""
+    return [{"type": "state_brief", "pages": groups[0]}
+            for kind, groups in tokens if kind == "state_brief"]
+
+
+def extract_case_cites(text: str) -> list[dict]:
+    """Extract all case citations from a paragraph."""
+    return _case_cites_from_scan(scan_citations(_clean_for_cite_match(text)))
+
+
+def extract_record_refs(text: str) -> RecordRefs:
+    """Extract record references from a paragraph."""
+    return _record_refs_from_scan(scan_citations(_clean_for_cite_match(text)))
+
+
 def extract_state_brief_refs(text: str) -> list[dict]:
     """Extract State's Brief page references."""
-    text = _clean_for_cite_match(text)
-    refs = []
-    for m in STATE_BRIEF_RE.finditer(text):
-        refs.append({"type": "state_brief", "pages": m.group(1)})
-    return refs
+    return _state_brief_refs_from_scan(scan_citations(_clean_for_cite_match(text)))
 
 
 # ---------------------------------------------------------------------------
 # Record lookup
 # ---------------------------------------------------------------------------
 
+def _index_record_pages(record_index: dict) -> dict[tuple[str, int], str]:
+    """Build the {(volume, page): text} lookup stored under "_by_key".
+
+    The first entry wins for duplicate (volume, page) pairs, matching the
+    old linear scan.
+    """
+    by_key = {}
+    for p in record_index.get("pages", []):
+        by_key.setdefault((p.get("volume"), p.get("page")), p.get("text", ""))
+    record_index["_by_key"] = by_key
+    return by_key
+
+
 def load_record_index(record_dir: Path) -> dict | None:
-    """Load record_index.json if it exists."""
+    """Load record_index.json if it exists, with a page lookup table."""
     idx_path = record_dir / "record_index.json"
     if not idx_path.exists():
         return None
     try:
-        return json.loads(idx_path.read_text())
+        record_index = json.loads(idx_path.read_text())
     except Exception:
         return None
+    _index_record_pages(record_index)
+    return record_index
 
 
 def get_record_page(record_index: dict, vol_type: str, vol_num: int, page: int) -> str | None:
     """Get the text of a specific record page."""
     if not record_index:
         return None
-    pages = record_index.get("pages", [])
+    by_key = record_index.get("_by_key")
+    if by_key is None:
+        by_key = _index_record_pages(record_index)
     vol_ref = f"{vol_type}{vol_num}" if vol_num > 0 else vol_type
-    for p in pages:
-        if p.get("volume") == vol_ref and p.get("page") == page:
-            return p.get("text", "")
-    return None
+    return by_key.get((vol_ref, page))
 
 
 # ---------------------------------------------------------------------------
 # Claude verification
 # ---------------------------------------------------------------------------
 
-VERIFY_PROMPT = """You are a meticulous legal cite-checker. You are checking a single paragraph from an appellate reply brief against ONE source.
+VERIFY_PROMPT = """You are a meticulous legal cite-checker. You are checking a single paragraph from an appellate reply brief against the source(s) provided below. Each source begins with a `=== label ===` header; check the paragraph against each one.
 
 ## Citation-scope rule
 
-A citation supports ONLY the sentence immediately before it. In the sequence "Sentence A. Sentence B. Case, 123 S.W.3d at 456. Sentence C. Sentence D." — the citation supports Sentence B only. Sentences A, C, and D are the author's own argument and must NOT be checked against this source.
+A citation supports ONLY the sentence immediately before it. In the sequence "Sentence A. Sentence B. Case, 123 S.W.3d at 456. Sentence C. Sentence D." — the citation supports Sentence B only. Sentences A, C, and D are the author's own argument and must NOT be checked against that source.
 
-**Exception — quotations:** Any text in quotation marks (inline or block) that is attributed to this source must be verified regardless of where it appears in the paragraph.
+**Exception — quotations:** Any text in quotation marks (inline or block) that is attributed to a provided source must be verified regardless of where it appears in the paragraph.
 
 To apply this rule:
-1. Find each citation to THIS source in the paragraph (full cite, short cite, or Id./id.).
+1. Find each citation to a provided source in the paragraph (full cite, short cite, or Id./id.).
 2. Identify the sentence immediately before that citation — that is the supported sentence.
-3. Check ONLY those supported sentences and any quotations attributed to this source.
+3. Check ONLY those supported sentences and any quotations attributed to that source.
 4. Do NOT check other sentences in the paragraph. They are argument, not source-supported propositions.
 
 ## What to check
 
 For each supported sentence or quotation:
 
-1. **Quotations**: Any text in quotation marks attributed to this source must be EXACT—verbatim. Ellipses (\u2026 or "...") may replace omitted text, and brackets ("[ ]") may indicate alterations—both are acceptable if the surrounding text is otherwise exact. Flag any quotation that adds, removes, or changes words beyond these conventions.
+1. **Quotations**: Any text in quotation marks attributed to a provided source must be EXACT—verbatim. Ellipses (\u2026 or "...") may replace omitted text, and brackets ("[ ]") may indicate alterations—both are acceptable if the surrounding text is otherwise exact. Flag any quotation that adds, removes, or changes words beyond these conventions.
 
 2. **Case assertions**: When the brief says a case "held" something, or describes what a court "found" or "concluded," verify that the case actually says that. Check the holding, the reasoning, and any pin cites.
 
@@ -641,7 +898,7 @@ For each assertion you check, output one entry. Output a JSON array:
 [
   {{
     "assertion": "<the specific claim being checked>",
-    "source": "<which source: case name, RR vol:page, State's Br., etc.>",
+    "source": "<which source: its === label ===, RR vol:page, State's Br., etc.>",
     "status": "VERIFIED|INACCURATE|QUOTE_ERROR|PIN_CITE_ERROR|UNSUPPORTED",
     "detail": "<explanation—if verified, say so briefly; if error, explain precisely what's wrong>"
   }}
@@ -654,11 +911,11 @@ Status meanings:
 - QUOTE_ERROR: A quotation is not verbatim (beyond ellipses/brackets).
 - PIN_CITE_ERROR: The pin cite page doesn't contain the referenced material.
 - UNSUPPORTED: The source doesn't address the proposition at all.
-- NEEDS_SOURCE: The assertion makes a SPECIFIC CLAIM ABOUT THIS SOURCE that can only be verified by reading a different source not provided here. In "detail", name the specific case(s) or source(s) needed using full citations (e.g. "Must check against Haywood v. State, 2014 WL 7131176").
+- NEEDS_SOURCE: The assertion makes a SPECIFIC CLAIM ABOUT A PROVIDED SOURCE that can only be verified by reading a different source not provided here. In "detail", name the specific case(s) or source(s) needed using full citations (e.g. "Must check against Haywood v. State, 2014 WL 7131176").
 
 IMPORTANT rules for NEEDS_SOURCE:
-- ONLY use it when the assertion directly claims something about THIS source (e.g., "none of the six opinions analyzes X" checked against the State's Brief — the six opinions are the needed sources).
-- Do NOT use NEEDS_SOURCE for assertions that simply aren't about this source. If an assertion is about a different case, statute, or rule, SKIP it entirely — it is not your job to check it.
+- ONLY use it when the assertion directly claims something about a provided source (e.g., "none of the six opinions analyzes X" checked against the State's Brief — the six opinions are the needed sources).
+- Do NOT use NEEDS_SOURCE for assertions that simply aren't about any provided source. If an assertion is about a different case, statute, or rule, SKIP it entirely — it is not your job to check it.
 - Do NOT flag statutory text or legal propositions as NEEDS_SOURCE. Only flag when the paragraph attributes a specific factual claim to authorities you haven't been given.
 
 Output ONLY the JSON array. No commentary, no markdown fencing. Begin with [ and end with ].
@@ -667,41 +924,203 @@ Output ONLY the JSON array. No commentary, no markdown fencing. Begin with [ and
 
 {paragraph}
 
-## Source:
+## Sources:
 
 {source}
 """
 
 
+def _split_prompt(template: str) -> list[str]:
+    """Literal text around each {field} of a str.format template, in order."""
+    pieces = [""]
+    for literal, field_name, _, _ in string.Formatter().parse(template):
+        pieces[-1] += literal
+        if field_name is not None:
+            pieces.append("")
+    return pieces
+
+
+# VERIFY_PROMPT split once into the literal text around its three slots
+# (with {{ }} already unescaped), so each prompt is plain concatenation
+# instead of str.format re-parsing the template.
+(_PROMPT_HEAD, _PROMPT_AFTER_LOCATION,
+ _PROMPT_AFTER_PARAGRAPH, _PROMPT_TAIL) = _split_prompt(VERIFY_PROMPT)
+
+
+def build_verify_prompt(location: str, paragraph: str, source: str) -> str:
+    """Fill VERIFY_PROMPT; equivalent to VERIFY_PROMPT.format(...)."""
+    return (f"{_PROMPT_HEAD}{location}{_PROMPT_AFTER_LOCATION}{paragraph}"
+            f"{_PROMPT_AFTER_PARAGRAPH}{source}{_PROMPT_TAIL}")
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+class ResponseCache:
+    """SQLite-backed store of parsed Claude responses keyed by prompt hash.
+
+    Re-runs (--start, crashes, prompt tuning, small edits to the brief)
+    repeat identical (paragraph, source) prompts; a hit skips the Claude
+    call entirely.
+    WAL mode plus a lock lets the verification threads share one connection;
+    synchronous=NORMAL skips the fsync on each commit (a crash of this
+    process still loses nothing, only a power failure could drop the
+    last few responses).
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key(prompt: str, model: str) -> str:
+        return hashlib.blake2b((model + prompt).encode()).hexdigest()
+
+    def get(self, key: str) -> list[dict] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if not row:
+            return None
+        # Entries saved before replies were checked for objects-only
+        # arrays may hold other JSON; treat those as misses
+        result = json.loads(row[0])
+        return result if _is_assertion_list(result) else None
+
+    def put(self, key: str, result: list[dict]):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, result) VALUES (?, ?)",
+                (key, json.dumps(result, separators=(",", ":"))),
+            )
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Set by main(); None disables caching (e.g. when imported as a library)
+response_cache: ResponseCache | None = None
+
+# Paragraph-level and per-source fan-out multiply, so the number of claude
+# processes running at once is capped here (main() sizes it from
+# --max-claude-calls).
+MAX_CLAUDE_CALLS = 8
+claude_slots = threading.BoundedSemaphore(MAX_CLAUDE_CALLS)
+
+
+@functools.lru_cache(maxsize=1)
+def _claude_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by every paragraph's per-batch calls.
+
+    Its threads mostly wait on claude_slots, which is what bounds the
+    number of claude processes; the pool just avoids building one per
+    paragraph.
+    """
+    return ThreadPoolExecutor(max_workers=32, thread_name_prefix="claude")
+
+
+def _retry_delay(attempt: int) -> float:
+    """Backoff before retry attempt+1, jittered so concurrent callers spread out."""
+    return 15 * (attempt + 1) * random.uniform(0.75, 1.25)
+
+
+@functools.lru_cache(maxsize=1)
 def claude_env():
-    """Environment with ANTHROPIC_API_KEY removed."""
+    """Environment with ANTHROPIC_API_KEY removed (built once, shared by every call)."""
     env = os.environ.copy()
     env.pop("ANTHROPIC_API_KEY", None)
     return env
 
 
-def _call_claude(prompt: str, model: str, label: str, max_retries: int = 3) -> list[dict]:
-    """Send a prompt to Claude and parse the JSON array response."""
+# Calls made this run, by cache key: a second caller with an identical
+# prompt (e.g. the same boilerplate paragraph citing the same source)
+# waits for or reuses the first call's result instead of making its own,
+# even under --no-cache. Failed (empty) calls are dropped so they can be
+# retried.
+_run_calls: dict[str, Future] = {}
+_run_calls_lock = threading.Lock()
+
+
+def _call_claude(prompt: str, model: str, label: str, max_retries: int = 3,
+                 cache_key: str | None = None) -> list[dict]:
+    """Send a prompt to Claude and parse the JSON array response.
+
+    Responses are served from / stored in response_cache when it is set,
+    under cache_key if given (else a hash of the prompt itself), and
+    reused for repeats of the same prompt within a run either way.
+    Empty results are not cached since they usually mean a failed call.
+    """
+    cache_key = cache_key or ResponseCache.key(prompt, model)
+    if response_cache is not None:
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    with _run_calls_lock:
+        shared = _run_calls.get(cache_key)
+        owner = shared is None
+        if owner:
+            shared = _run_calls[cache_key] = Future()
+    if not owner:
+        # Copies, since callers may modify the assertion dicts
+        return [dict(a) for a in shared.result()]
+
+    # Waiting callers block on shared, so it must be resolved on every
+    # path; a failed or empty call is also dropped so it can be retried
+    try:
+        results = _run_claude(prompt, model, label, max_retries)
+        if results and response_cache is not None:
+            response_cache.put(cache_key, results)
+    except BaseException as e:
+        with _run_calls_lock:
+            del _run_calls[cache_key]
+        shared.set_exception(e)
+        raise
+    if not results:
+        with _run_calls_lock:
+            del _run_calls[cache_key]
+    shared.set_result([dict(a) for a in results])
+    return results
+
+
+def _run_claude(prompt: str, model: str, label: str, max_retries: int) -> list[dict]:
+    """Run the claude CLI on a prompt, retrying failures; [] if every attempt fails."""
     for attempt in range(max_retries):
         try:
             cmd = ["claude", "--print", "--model", model]
-            result = subprocess.run(
-                cmd, input=prompt, capture_output=True, text=True,
-                timeout=300, env=claude_env(),
-            )
+            with claude_slots:
+                result = subprocess.run(
+                    cmd, input=prompt, capture_output=True, text=True,
+                    timeout=300, env=claude_env(),
+                )
 
             if result.returncode != 0:
                 err = result.stderr.strip() or result.stdout.strip()
                 print(f"    {label}: Claude error (attempt {attempt+1}): {err[:200]}", file=sys.stderr)
                 if attempt < max_retries - 1:
-                    time.sleep(15 * (attempt + 1))
+                    time.sleep(_retry_delay(attempt))
                 continue
 
             text = result.stdout.strip()
             if not text:
                 print(f"    {label}: empty response (attempt {attempt+1})", file=sys.stderr)
                 if attempt < max_retries - 1:
-                    time.sleep(15 * (attempt + 1))
+                    time.sleep(_retry_delay(attempt))
                 continue
 
             return parse_json_array(text, label)
@@ -709,56 +1128,127 @@ def _call_claude(prompt: str, model: str, label: str, max_retries: int = 3) -> l
         except subprocess.TimeoutExpired:
             print(f"    {label}: timeout (attempt {attempt+1})", file=sys.stderr)
             if attempt < max_retries - 1:
-                time.sleep(15 * (attempt + 1))
+                time.sleep(_retry_delay(attempt))
 
     return []
 
 
+# Sources share a prompt up to both limits; a source larger than the
+# character budget still gets a prompt of its own.
+MAX_SOURCES_PER_PROMPT = 4
+MAX_PROMPT_SOURCE_CHARS = 80_000
+
+# A single source longer than this (~150K tokens at ~4 chars/token) won't
+# fit the model's 200K-token context with the instructions and paragraph,
+# so it is reported as NOT_CHECKED instead of failing after every retry.
+MAX_SOURCE_CHARS = 600_000
+
+
+def _batch_sources(sources: list[tuple[str, str]]) -> list[list[tuple[str, str]]]:
+    """Pack sources into as few shared prompts as the limits allow.
+
+    Each source goes into the first batch with room for it (first fit),
+    so a large source between small ones doesn't strand them in prompts
+    of their own. Sources keep their relative order within a batch.
+    """
+    batches = []
+    batch_chars = []
+    for label, text in sources:
+        for i, batch in enumerate(batches):
+            if (len(batch) < MAX_SOURCES_PER_PROMPT
+                    and batch_chars[i] + len(text) <= MAX_PROMPT_SOURCE_CHARS):
+                batch.append((label, text))
+                batch_chars[i] += len(text)
+                break
+        else:
+            batches.append([(label, text)])
+            batch_chars.append(len(text))
+    return batches
+
+
 def verify_paragraph(para_num: int, paragraph: str, sources: list[tuple[str, str]],
-                     model: str = "opus", workers: int = 4,
-                     page_num: int | None = None) -> list[dict]:
-    """Verify a paragraph against each source in parallel (one prompt per source).
+                     model: str = "opus",
+                     page_num: int | None = None,
+                     location: str | None = None) -> list[dict]:
+    """Verify a paragraph against its sources in parallel.
+
+    Small sources are batched so the paragraph and instructions are sent
+    once per batch rather than once per source (see _batch_sources).
 
     sources: list of (label, source_text) — e.g. ("Bell v. Wolfish, 441 U.S. 520", full_text)
+    location: how the prompt refers to the paragraph (default: its page or number)
     Returns merged list of assertion dicts from all sources.
     """
     if not sources:
         return []
 
-    location = f"page {page_num}" if page_num else f"paragraph {para_num}"
+    if location is None:
+        location = f"page {page_num}" if page_num else f"paragraph {para_num}"
     all_assertions = []
 
-    # Build prompts
-    tasks = []
-    for label, source_text in sources:
-        prompt = VERIFY_PROMPT.format(
-            location=location,
-            paragraph=paragraph,
-            source=f"=== {label} ===\n{segment_by_pages(source_text)}",
-        )
-        tasks.append((prompt, label))
+    oversize = [(label, text) for label, text in sources if len(text) > MAX_SOURCE_CHARS]
+    for label, source_text in oversize:
+        print(f"    Para {para_num}/{label[:30]}: source is {len(source_text):,} chars, "
+              f"over the {MAX_SOURCE_CHARS:,}-char limit; not sent", file=sys.stderr)
+        all_assertions.append({
+            "assertion": "Assertions citing this source",
+            "source": label,
+            "status": "NOT_CHECKED",
+            "detail": f"Source text is {len(source_text):,} characters, too large to send "
+                      f"in one prompt. Check by hand.",
+        })
+    if oversize:
+        sources = [(label, text) for label, text in sources if len(text) <= MAX_SOURCE_CHARS]
+        if not sources:
+            return all_assertions
 
-    # Run in parallel
-    with ThreadPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
-        futures = {}
-        for prompt, label in tasks:
-            future = executor.submit(_call_claude, prompt, model, f"Para {para_num}/{label}")
-            futures[future] = label
+    # The cache key leaves out the location and whitespace-only differences
+    # in the paragraph, so a re-run after edits that reflow pages or fix
+    # spacing still reuses prior results; any change to the words misses.
+    cache_paragraph = " ".join(paragraph.split())
 
-        for future in as_completed(futures):
-            label = futures[future]
-            try:
-                results = future.result()
-                all_assertions.extend(results)
-            except Exception as e:
-                print(f"    Para {para_num}/{label}: FAILED — {e}", file=sys.stderr)
+    # Build prompts — one per batch of sources
+    tasks = []
+    for batch in _batch_sources(sources):
+        source = "\n\n".join(f"=== {label} ===\n{segment_by_pages(source_text)}"
+                             for label, source_text in batch)
+        prompt = build_verify_prompt(location=location, paragraph=paragraph, source=source)
+        cache_key = ResponseCache.key(
+            build_verify_prompt(location="", paragraph=cache_paragraph, source=source), model)
+        label = " + ".join(label[:30] for label, _ in batch)
+        tasks.append((prompt, label, cache_key))
+
+    # Run in parallel on the shared call pool; a lone batch (the usual case)
+    # runs in this thread
+    if len(tasks) == 1:
+        prompt, label, cache_key = tasks[0]
+        try:
+            all_assertions.extend(_call_claude(prompt, model, f"Para {para_num}/{label}",
+                                               cache_key=cache_key))
+        except Exception as e:
+            print(f"    Para {para_num}/{label}: FAILED — {e}", file=sys.stderr)
+        return all_assertions
+
+    futures = {}
+    for prompt, label, cache_key in tasks:
+        future = _claude_executor().submit(_call_claude, prompt, model, f"Para {para_num}/{label}",
+                                           cache_key=cache_key)
+        futures[future] = label
+
+    for future in as_completed(futures):
+        label = futures[future]
+        try:
+            results = future.result()
+            all_assertions.extend(results)
+        except Exception as e:
+            print(f"    Para {para_num}/{label}: FAILED — {e}", file=sys.stderr)
 
     return all_assertions
 
 
 def resolve_needs_source(para_num: int, paragraph: str, assertions: list[dict],
                          auth_files: dict[str, str], model: str = "opus",
-                         workers: int = 4, page_num: int | None = None,
+                         page_num: int | None = None,
                          cite_index: dict[str, str] | None = None) -> list[dict]:
     """Second pass: resolve NEEDS_SOURCE assertions by finding the named authorities.
 
@@ -778,7 +1268,7 @@ def resolve_needs_source(para_num: int, paragraph: str, assertions: list[dict],
         # Extract WL citations from the detail text
         for m in WL_CITE_RE.finditer(detail):
             wl = m.group(0)
-            match = find_authority("", "", "WL", wl.split("WL")[1].strip(),
+            match = find_authority("", "", "WL", wl.partition("WL")[2].strip(),
                                    auth_files, cite_index=cite_index)
             if match and match[0] not in seen_fnames:
                 seen_fnames.add(match[0])
@@ -795,14 +1285,14 @@ def resolve_needs_source(para_num: int, paragraph: str, assertions: list[dict],
     if not extra_sources:
         return assertions
 
-    print(f"  Second pass: {len(extra_sources)} additional source(s) for NEEDS_SOURCE")
-    for fname, _ in extra_sources:
-        print(f"    + {fname[:60]}")
+    # One print call, labelled, since paragraphs are checked concurrently
+    print(f"  Para {para_num} second pass: {len(extra_sources)} additional source(s) "
+          f"for NEEDS_SOURCE\n" + "\n".join(f"    + {fname[:60]}" for fname, _ in extra_sources))
 
     # Run verification against the new sources
     source_tuples = [(fname, text) for fname, text in extra_sources]
     new_assertions = verify_paragraph(para_num, paragraph, source_tuples,
-                                      model=model, workers=workers,
+                                      model=model,
                                       page_num=page_num)
 
     # Replace NEEDS_SOURCE entries with the new results (drop any cascading NEEDS_SOURCE)
@@ -811,89 +1301,292 @@ def resolve_needs_source(para_num: int, paragraph: str, assertions: list[dict],
     return kept
 
 
+_json_decoder = json.JSONDecoder()
+
+
+def _is_assertion_list(parsed) -> bool:
+    """True for a JSON array whose elements are all objects (assertion dicts)."""
+    return isinstance(parsed, list) and all(isinstance(a, dict) for a in parsed)
+
+
 def parse_json_array(text: str, label: str = "") -> list[dict]:
-    """Extract a JSON array from text that may contain markdown fences."""
-    text = re.sub(r"^```(?:json)?\s*\n?", "", text.strip())
-    text = re.sub(r"\n?```\s*$", "", text)
+    """Extract a JSON array of objects from text that may contain markdown fences.
+
+    Arrays holding anything but objects (["..."], [[...]]) are skipped,
+    so callers can treat every element as an assertion dict.
+    """
+    text = text.strip()
+    if text.startswith("```"):
+        text = text[3:].removeprefix("json").lstrip()
+    if text.endswith("```"):
+        text = text[:-3].rstrip()
 
     try:
         parsed = json.loads(text)
-        if isinstance(parsed, list):
+        if _is_assertion_list(parsed):
             return parsed
     except json.JSONDecodeError:
         pass
 
+    # Array embedded in surrounding prose: decode from each "[" in turn.
+    # raw_decode stops at the end of the array and, unlike bracket
+    # counting, isn't thrown off by brackets inside strings ("[PAGE 982]").
     start = text.find("[")
-    if start != -1:
-        depth = 0
-        for i in range(start, len(text)):
-            if text[i] == "[":
-                depth += 1
-            elif text[i] == "]":
-                depth -= 1
-                if depth == 0:
-                    try:
-                        return json.loads(text[start:i + 1])
-                    except json.JSONDecodeError:
-                        break
+    while start != -1:
+        try:
+            parsed, _ = _json_decoder.raw_decode(text, start)
+            if _is_assertion_list(parsed):
+                return parsed
+        except json.JSONDecodeError:
+            pass
+        start = text.find("[", start + 1)
 
     print(f"    {label}: could not parse JSON ({len(text)} chars): {text[:200]}", file=sys.stderr)
     return []
 
 
+GROUP_NOTE = """\
+These {count} consecutive paragraphs cite the same or overlapping sources, so they are checked together; apply the citation-scope rule to each paragraph separately. Each begins with a [Paragraph N] marker. Add a "paragraph": N field to every assertion object naming the paragraph it comes from."""
+
+
+def verify_paragraph_group(group: list[tuple[int, str, int | None]],
+                           sources: list[tuple[str, str]],
+                           model: str = "opus") -> dict[int, list[dict]] | None:
+    """Verify consecutive paragraphs that share sources in one prompt.
+
+    group: [(para_num, paragraph, page_num), ...]
+    Returns {para_num: assertions}, or None if any assertion isn't tagged
+    with one of the group's paragraph numbers (the caller then checks
+    the paragraphs one at a time rather than guess).
+    """
+    paragraph = GROUP_NOTE.format(count=len(group)) + "\n\n" + "\n\n".join(
+        f"[Paragraph {para_num}] {text}" for para_num, text, _ in group)
+    pages = sorted({page_num for _, _, page_num in group if page_num})
+    if pages:
+        location = "page " + str(pages[0]) if len(pages) == 1 else f"pages {pages[0]}–{pages[-1]}"
+    else:
+        location = f"paragraphs {group[0][0]}–{group[-1][0]}"
+
+    assertions = verify_paragraph(group[0][0], paragraph, sources, model=model,
+                                  location=location)
+
+    by_para = {para_num: [] for para_num, _, _ in group}
+    for a in assertions:
+        if a.get("status") == "NOT_CHECKED" and "paragraph" not in a:
+            # An oversize source that was never sent applies to every paragraph
+            for para_assertions in by_para.values():
+                para_assertions.append(dict(a))
+            continue
+        try:
+            para_num = int(a.pop("paragraph"))
+        except (KeyError, TypeError, ValueError):
+            return None
+        if para_num not in by_para:
+            return None
+        by_para[para_num].append(a)
+    return by_para
+
+
+def merge_group_sources(group_sources: list[tuple[str, str]],
+                        sources: list[tuple[str, str]]) -> list[tuple[str, str]] | None:
+    """Sources for an open paragraph group that a new paragraph could join.
+
+    Identical source texts (labels may differ by an "(Id.)" suffix) join
+    as is. Otherwise the paragraph must share at least one source with
+    the group, and the union must still fit one prompt, so grouping never
+    adds a call or sends a paragraph a source too large to check.
+    Returns None if the paragraph can't join.
+    """
+    if [t for _, t in sources] == [t for _, t in group_sources]:
+        return group_sources
+    group_texts = {t for _, t in group_sources}
+    added = [(label, t) for label, t in sources if t not in group_texts]
+    if len(added) == len(sources):
+        return None  # nothing in common
+    merged = group_sources + added
+    if (len(merged) > MAX_SOURCES_PER_PROMPT
+            or sum(len(t) for _, t in merged) > MAX_PROMPT_SOURCE_CHARS):
+        return None
+    return merged
+
+
+def check_paragraph_group(group: list[tuple[int, str, int | None]],
+                          sources: list[tuple[str, str]],
+                          auth_files: dict[str, str], model: str = "opus",
+                          cite_index: dict[str, str] | None = None,
+                          member_sources: dict[int, list[tuple[str, str]]] | None = None
+                          ) -> dict[int, list[dict]]:
+    """Run both verification passes for paragraphs whose (shared) sources are gathered.
+
+    group: [(para_num, paragraph, page_num), ...]; a single paragraph is
+    checked on its own. Returns {para_num: assertions}.
+    member_sources: each paragraph's own sources, by para_num. When the
+    grouped reply can't be split by paragraph, each paragraph is checked
+    separately against only these, not the group's merged sources.
+    """
+    by_para = None
+    if len(group) > 1:
+        by_para = verify_paragraph_group(group, sources, model=model)
+        if by_para is None:
+            print(f"  Paragraphs {group[0][0]}–{group[-1][0]}: untagged assertions, "
+                  f"checking separately", file=sys.stderr)
+
+    results = {}
+    for para_num, paragraph, page_num in group:
+        if by_para is None:
+            own_sources = (member_sources or {}).get(para_num, sources)
+            results[para_num] = verify_paragraph(para_num, paragraph, own_sources, model=model,
+                                                 page_num=page_num)
+        else:
+            results[para_num] = by_para[para_num]
+
+    # Second pass: resolve any NEEDS_SOURCE assertions. A group's
+    # paragraphs are independent here, so their second passes run together
+    # rather than one after another.
+    needing = [(para_num, paragraph, page_num) for para_num, paragraph, page_num in group
+               if any(a.get("status") == "NEEDS_SOURCE" for a in results[para_num])]
+    if len(needing) == 1:
+        para_num, paragraph, page_num = needing[0]
+        results[para_num] = resolve_needs_source(para_num, paragraph, results[para_num],
+                                                 auth_files, model=model, page_num=page_num,
+                                                 cite_index=cite_index)
+    elif needing:
+        with ThreadPoolExecutor(max_workers=len(needing)) as executor:
+            futures = {
+                para_num: executor.submit(resolve_needs_source, para_num, paragraph,
+                                          results[para_num], auth_files, model=model,
+                                          page_num=page_num, cite_index=cite_index)
+                for para_num, paragraph, page_num in needing
+            }
+        for para_num, future in futures.items():
+            results[para_num] = future.result()
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Source gathering
 # ---------------------------------------------------------------------------
 
 
+# Quoted passages, and language that describes what a cited case held
+# (either one near a cite means the case needs its full text)
+QUOTATION_RE = re.compile(r'["\u201c][^"\u201d]+["\u201d]')
+HOLDING_LANGUAGE_RE = re.compile(
+    r'\b(?:held|holds|holding|found|finding|concluded|concluding|explained|reasoned|recognized)\b',
+    re.IGNORECASE,
+)
+
+# --string-cite-excerpts: how much of a merely string-cited (or, with
+# --named-case-excerpts, merely named) case is sent, and how far around
+# the cite to look for quotations and holding language
+CITATION_ONLY_CHARS = 1500
+HOLDING_LANGUAGE_WINDOW = 200
+
+CITATION_ONLY_NOTE = (
+    "[CITATION-ONLY EXCERPT: only the opening of this opinion is provided "
+    "because the paragraph neither quotes it nor describes its holding. "
+    "Check only that the citation matches it; report any other assertion "
+    "citing this source with status NOT_CHECKED.]\n\n"
+)
+
+NAMED_CASE_NOTE = (
+    "[NAMED-CASE EXCERPT: the paragraph names this case without citing it, "
+    "so only the opening of the opinion is provided, to identify it. Do not "
+    "verify any assertion against it; if an assertion turns on what this "
+    "case held, report NEEDS_SOURCE with its full citation.]\n\n"
+)
+
+
+def _is_string_cite(clean_para: str, cite: dict, quote_spans: list[tuple[int, int]]) -> bool:
+    """Return True when a case is cited without quoting it or describing its holding.
+
+    A quotation is attributed to the cite by position: any quotation
+    within HOLDING_LANGUAGE_WINDOW of the cite keeps the full text,
+    whether or not its words match the opinion (a misquote is exactly
+    what the check must catch). Errs toward False (send the full text)
+    whenever the cite can't be located in the paragraph.
+    """
+    anchor = cite["case_name"] or f"{cite['volume']} {cite['reporter']}".strip()
+    pos = clean_para.find(anchor) if anchor else -1
+    if pos < 0:
+        return False
+    lo = max(0, pos - HOLDING_LANGUAGE_WINDOW)
+    hi = pos + len(anchor) + HOLDING_LANGUAGE_WINDOW
+    if any(start < hi and end > lo for start, end in quote_spans):
+        return False
+    return not HOLDING_LANGUAGE_RE.search(clean_para, lo, hi)
+
+
 def gather_sources(paragraph: str, auth_files: dict[str, str],
                    record_index: dict | None, state_brief_text: str | None,
                    last_case: dict | None,
                    cite_index: dict[str, str] | None = None,
-                   id_target: dict | None = None) -> tuple[list[tuple[str, str]], dict | None]:
+                   id_target: dict | None = None,
+                   tokens: list[tuple[str, tuple]] | None = None,
+                   excerpt_string_cites: bool = False,
+                   named_case_excerpts: bool = False) -> tuple[list[tuple[str, str]], dict | None]:
     """Gather all source materials referenced in this paragraph.
 
     Returns (sources, last_case_cited) where sources is a list of
-    (label, full_text) tuples — one per source, each sent as a
-    separate verification prompt.
+    (label, full_text) tuples — one per source; verify_paragraph
+    batches them into prompts.
 
     id_target: if provided, the case name that Id. refers to in this
     paragraph (from build_id_map preprocessing). Overrides last_case
     for Id. resolution.
+
+    tokens: the paragraph's scan_citations result, if already computed.
+
+    excerpt_string_cites: send only the opening of a case the paragraph
+    neither quotes nor describes (see _is_string_cite), labelled as a
+    citation-only excerpt.
+
+    named_case_excerpts: also send the opening of a case the paragraph
+    names without citing (see find_authority_by_name), so the model can
+    ask for it by full citation.
     """
     sources = []
     current_last_case = last_case
     clean_para = _clean_for_cite_match(paragraph)
+    low_para = clean_para.lower()
+    # One tokenizer pass feeds every citation kind below
+    if tokens is None:
+        tokens = scan_citations(clean_para)
+    kinds = {kind for kind, _ in tokens}
 
     # --- State's Brief ---
-    sb_refs = extract_state_brief_refs(paragraph)
-    needs_state_brief = bool(sb_refs) or bool(STATE_ARGUES_RE.search(clean_para))
+    needs_state_brief = "state_brief" in kinds or (
+        _has_state(low_para) and bool(STATE_ARGUES_RE.search(clean_para)))
     if needs_state_brief and state_brief_text:
         sources.append(("State's Brief", state_brief_text))
 
     # --- Record references (group all record pages into one source) ---
-    record_refs = extract_record_refs(paragraph)
+    record_refs = _record_refs_from_scan(tokens)
     record_parts = []
-    for ref in record_refs:
-        if ref["type"] == "rr":
-            page_text = get_record_page(record_index, "RR", ref["volume"], ref["page"])
-            if page_text:
-                record_parts.append(f"--- RR{ref['volume']}:{ref['page']} ---\n{page_text}")
-            else:
-                record_parts.append(f"--- RR{ref['volume']}:{ref['page']} --- [PAGE NOT FOUND IN INDEX]")
-        elif ref["type"] == "cr":
-            page_text = get_record_page(record_index, "CR", 0, ref["page"])
-            if page_text:
-                record_parts.append(f"--- CR:{ref['page']} ---\n{page_text}")
-            else:
-                record_parts.append(f"--- CR:{ref['page']} --- [PAGE NOT FOUND IN INDEX]")
-        elif ref["type"] == "exhibit":
-            record_parts.append(f"--- SX{ref['number']} {ref['timestamp']} --- [EXHIBIT VERIFICATION NOT AVAILABLE]")
+    for volume, page in record_refs.rr:
+        page_text = get_record_page(record_index, "RR", volume, page)
+        if page_text:
+            record_parts.append(f"--- RR{volume}:{page} ---\n{page_text}")
+        else:
+            record_parts.append(f"--- RR{volume}:{page} --- [PAGE NOT FOUND IN INDEX]")
+    for page in record_refs.cr:
+        page_text = get_record_page(record_index, "CR", 0, page)
+        if page_text:
+            record_parts.append(f"--- CR:{page} ---\n{page_text}")
+        else:
+            record_parts.append(f"--- CR:{page} --- [PAGE NOT FOUND IN INDEX]")
+    for number, timestamp in record_refs.exhibits:
+        record_parts.append(f"--- SX{number} {timestamp} --- [EXHIBIT VERIFICATION NOT AVAILABLE]")
     if record_parts:
         sources.append(("Record", "\n\n".join(record_parts)))
 
     # --- Case citations (one source per case) ---
-    case_cites = extract_case_cites(paragraph)
+    case_cites = _case_cites_from_scan(tokens)
+    # An Id. cite may lean on any case here, so those paragraphs keep full texts
+    excerpt_string_cites = excerpt_string_cites and "id" not in kinds
+    quote_spans = ([m.span() for m in QUOTATION_RE.finditer(clean_para)]
+                   if excerpt_string_cites else [])
+    loaded = set()
     for cite in case_cites:
         match = find_authority(
             cite["case_name"], cite["volume"], cite["reporter"], cite["page"],
@@ -901,12 +1594,39 @@ def gather_sources(paragraph: str, auth_files: dict[str, str],
         )
         if match:
             fname, text = match
-            sources.append((fname, text))
+            if excerpt_string_cites and _is_string_cite(clean_para, cite, quote_spans):
+                sources.append((f"{fname} (citation-only excerpt)",
+                                CITATION_ONLY_NOTE + text[:CITATION_ONLY_CHARS]))
+            else:
+                sources.append((fname, text))
+            loaded.add(fname)
             current_last_case = {"name": fname, "text": text}
 
+    # --- Cases named without a reporter cite ---
+    # A claim about a provided source (e.g. what the State's cases hold)
+    # often turns on a case the paragraph only names. Its opening gives
+    # the model the full citation to name in a NEEDS_SOURCE, which
+    # resolve_needs_source can then look up. Only bare names count: a
+    # name followed by a reporter cite was already looked up by that cite.
+    if named_case_excerpts and "v." in clean_para:
+        names = list(CASE_NAME_RE.finditer(clean_para))
+        for m, after in zip(names, names[1:] + [None]):
+            # The window stops at the next case name so its cite isn't borrowed
+            hi = m.end() + NAME_CITE_WINDOW
+            if after is not None:
+                hi = min(hi, after.start())
+            if NAME_CITE_RE.search(clean_para, m.end(), hi):
+                continue
+            match = find_authority_by_name(m.group(1), m.group(2), auth_files)
+            if match and match[0] not in loaded:
+                fname, text = match
+                sources.append((f"{fname} (named in paragraph)",
+                                NAMED_CASE_NOTE + text[:CITATION_ONLY_CHARS]))
+                loaded.add(fname)
+
     # Handle Id. citations — resolve to the correct authority.
     # id_target (from build_id_map) is authoritative when available.
-    if ID_CITE_RE.search(clean_para):
+    if "id" in kinds:
         id_resolved = False
         if id_target:
             # Use find_authority for precise matching with vol/reporter/page
@@ -918,7 +1638,7 @@ def gather_sources(paragraph: str, auth_files: dict[str, str],
             if match:
                 fname, ftext = match
                 # Avoid duplicates if the same source is already loaded
-                if not any(fname == s[0] for s in sources):
+                if fname not in loaded:
                     sources.append((f"{fname} (Id.)", ftext))
                 id_resolved = True
         if not id_resolved and last_case:
@@ -936,37 +1656,131 @@ def gather_sources(paragraph: str, auth_files: dict[str, str],
 # DOCX extraction
 # ---------------------------------------------------------------------------
 
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# Run children that contribute text, and what python-docx renders them as
+# (None means the element's own text)
+_RUN_TEXT = {
+    f"{W_NS}t": None,
+    f"{W_NS}tab": "\t",
+    f"{W_NS}ptab": "\t",
+    f"{W_NS}cr": "\n",
+    f"{W_NS}noBreakHyphen": "-",
+}
+
+
+def _run_text(run) -> str:
+    """Return a w:r element's text the way python-docx's Run.text does."""
+    parts = []
+    for e in run:
+        if e.tag in _RUN_TEXT:
+            parts.append(_RUN_TEXT[e.tag] or e.text or "")
+        elif e.tag == f"{W_NS}br":
+            # Page and column breaks contribute no text
+            if e.get(f"{W_NS}type", "textWrapping") == "textWrapping":
+                parts.append("\n")
+    return "".join(parts)
+
+
+def _paragraph_text(p) -> str:
+    """Return a w:p element's text the way python-docx's Paragraph.text does."""
+    parts = []
+    for child in p:
+        if child.tag == f"{W_NS}r":
+            parts.append(_run_text(child))
+        elif child.tag == f"{W_NS}hyperlink":
+            parts.extend(_run_text(r) for r in child.iterfind(f"{W_NS}r"))
+    return "".join(parts)
+
+
+RELS_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def _main_document_part(z: zipfile.ZipFile) -> str:
+    """Return the zip member holding the main document body.
+
+    Word names it word/document.xml, but the package only promises it is
+    the target of the officeDocument relationship in _rels/.rels
+    (python-docx follows that relationship too).
+    """
+    try:
+        rels = ET.fromstring(z.read("_rels/.rels"))
+    except KeyError:
+        return "word/document.xml"
+    for rel in rels.iter(f"{RELS_NS}Relationship"):
+        if rel.get("Type", "").endswith("/officeDocument") and rel.get("TargetMode") != "External":
+            return rel.get("Target", "").lstrip("/")
+    return "word/document.xml"
+
+
 def extract_paragraphs(docx_path: Path) -> list[tuple[int, str]]:
-    """Extract non-empty paragraphs from a DOCX, returning (index, text)."""
-    doc = docx.Document(str(docx_path))
+    """Extract non-empty paragraphs from a DOCX, returning (index, text).
+
+    The main document part is streamed rather than loaded via docx.Document,
+    so only one body element is in memory at a time. Indices and text
+    match python-docx's doc.paragraphs (direct w:p children of w:body).
+    """
     paragraphs = []
-    for i, p in enumerate(doc.paragraphs):
-        text = p.text.strip()
-        if text:
-            paragraphs.append((i, text))
+    i = 0
+    depth = 0
+    body = None
+    with zipfile.ZipFile(docx_path) as z, z.open(_main_document_part(z)) as fh:
+        for event, elem in ET.iterparse(fh, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if depth == 2:
+                    body = elem
+                continue
+            depth -= 1
+            if depth != 2:
+                continue
+            # A complete top-level body element
+            if elem.tag == f"{W_NS}p":
+                text = _paragraph_text(elem).strip()
+                if text:
+                    paragraphs.append((i, text))
+                i += 1
+            body.clear()
     return paragraphs
 
 
-def build_page_map(docx_path: Path) -> list[str]:
+def build_page_map(docx_path: Path, stop: threading.Event | None = None) -> list[str]:
     """Convert DOCX to PDF via LibreOffice and extract text per page.
 
     Returns a list of page texts, indexed by page number (0-based).
+    Raises RuntimeError if LibreOffice produced no PDF, or if stop is set
+    while it runs (LibreOffice is then killed rather than left running).
     """
     import tempfile
     import shutil
 
+    import fitz  # PyMuPDF
+
     with tempfile.TemporaryDirectory() as tmpdir:
         # Convert DOCX → PDF
-        result = subprocess.run(
-            ["soffice", "--headless", "--convert-to", "pdf",
-             "--outdir", tmpdir, str(docx_path)],
-            capture_output=True, text=True, timeout=60,
-        )
+        cmd = ["soffice", "--headless", "--convert-to", "pdf",
+               "--outdir", tmpdir, str(docx_path)]
+        # soffice is a wrapper script, so it gets its own process group and
+        # the whole group is killed (killing the wrapper leaves soffice.bin)
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                text=True, start_new_session=True)
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                _, stderr = proc.communicate(timeout=0.5)
+                break
+            except subprocess.TimeoutExpired:
+                stopped = stop is not None and stop.is_set()
+                if stopped or time.monotonic() > deadline:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                    proc.communicate()
+                    if stopped:
+                        raise RuntimeError("PDF conversion stopped")
+                    raise subprocess.TimeoutExpired(cmd, 60)
         pdf_name = docx_path.stem + ".pdf"
         pdf_path = Path(tmpdir) / pdf_name
         if not pdf_path.exists():
-            print(f"  Warning: PDF conversion failed: {result.stderr.strip()[:200]}", file=sys.stderr)
-            return []
+            raise RuntimeError(f"PDF conversion failed: {stderr.strip()[:200]}")
 
         # Extract text per page
         doc = fitz.open(str(pdf_path))
@@ -977,36 +1791,133 @@ def build_page_map(docx_path: Path) -> list[str]:
         return pages
 
 
-def find_page_number(paragraph_text: str, page_texts: list[str]) -> int | None:
-    """Find which page a paragraph starts on by matching its opening text.
+def load_page_map(docx_path: Path, use_cache: bool = True,
+                  stop: threading.Event | None = None) -> tuple[list[str], str, list[str]]:
+    """Return build_page_map's page texts, reusing the last run's if the DOCX is unchanged.
 
-    Returns 1-based page number, or None if not found.
+    The LibreOffice conversion takes several seconds, so its result is
+    saved beside the brief keyed by the DOCX's modification time and size.
+    Runs on a background thread, so instead of printing it returns
+    (pages, status, warnings) for main to report; setting stop ends the
+    conversion early (see build_page_map).
     """
+    cache_path = docx_path.with_name(f".{docx_path.name}.pagemap.json")
+    stat = docx_path.stat()
+    key = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    if use_cache:
+        try:
+            data = json.loads(cache_path.read_text())
+            if data["key"] == key:
+                return data["pages"], "reusing cached PDF conversion", []
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    try:
+        pages = build_page_map(docx_path, stop)
+    except ImportError:
+        return [], "PyMuPDF not installed", ["PyMuPDF (fitz) is not installed"]
+    except RuntimeError as e:
+        return [], "PDF conversion failed", [str(e)]
+    warnings = []
+    if pages and use_cache:
+        try:
+            cache_path.write_text(json.dumps({"key": key, "pages": pages}))
+        except OSError as e:
+            warnings.append(f"could not save page map cache: {e}")
+    return pages, "converted to PDF", warnings
+
+
+@dataclass
+class PageIndex:
+    """Whitespace-normalized page texts joined into one searchable string."""
+    text: str
+    offsets: list[int]  # start of each page within text
+
+
+# Normalizing splits on whitespace, which includes this separator, so no
+# page contains it and a match can never span two pages
+PAGE_SEPARATOR = "\x1f"
+
+
+def build_page_index(page_texts: list[str]) -> PageIndex | None:
+    """Normalize every page once and record where each one starts."""
     if not page_texts:
         return None
+    norm_pages = [" ".join(page_text.split()) for page_text in page_texts]
+    offsets = []
+    pos = 0
+    for norm_page in norm_pages:
+        offsets.append(pos)
+        pos += len(norm_page) + len(PAGE_SEPARATOR)
+    return PageIndex(PAGE_SEPARATOR.join(norm_pages), offsets)
+
 
-    # Normalize whitespace for matching
-    def normalize(s: str) -> str:
-        return re.sub(r'\s+', ' ', s.strip())
+def find_page_number(paragraph_text: str, page_index: PageIndex | None) -> int | None:
+    """Find which page a paragraph starts on by matching its opening text.
+
+    Returns 1-based page number, or None if not found.
+    """
+    if page_index is None:
+        return None
 
     # Use the first 80 chars of the paragraph as search key
     # (enough to be unique, short enough to avoid line-break mismatches)
-    norm_para = normalize(paragraph_text)
+    norm_para = " ".join(paragraph_text.split())
     snippet = norm_para[:80]
     if len(snippet) < 15:
         snippet = norm_para  # very short paragraph — use it all
 
-    for i, page_text in enumerate(page_texts):
-        if snippet in normalize(page_text):
-            return i + 1  # 1-based page number
+    pos = page_index.text.find(snippet)
+    if pos < 0:
+        # Fallback: try shorter prefix (page breaks can split words)
+        pos = page_index.text.find(norm_para[:40])
+    if pos < 0:
+        return None
+    return bisect.bisect_right(page_index.offsets, pos)  # 1-based page number
 
-    # Fallback: try shorter prefix (page breaks can split words)
-    snippet = norm_para[:40]
-    for i, page_text in enumerate(page_texts):
-        if snippet in normalize(page_text):
-            return i + 1
 
-    return None
+# Headings that open the body of the brief (after the TOC and index of
+# authorities)
+BODY_START_HEADINGS = frozenset({
+    "argument", "summary of reply argument", "summary of argument", "summary of the argument",
+})
+
+
+def find_body_bounds(paragraphs: list[tuple[int, str]]) -> tuple[int, int]:
+    """Return (start, end) indexes of the brief's body within paragraphs.
+
+    The body starts at the first "Argument"/"Summary of ..." heading (or
+    the first paragraph) and ends at the last "Prayer" after it, or
+    failing that the first "Certificate of ..." after it, or the end.
+    One pass, stripping and lowering each paragraph once.
+    """
+    body_start = None
+    last_prayer = first_certificate = None
+    for idx, (_, text) in enumerate(paragraphs):
+        lower = text.strip().lower()
+        if body_start is None and lower in BODY_START_HEADINGS:
+            body_start = idx
+            # Only endings after the body start count
+            last_prayer = first_certificate = None
+            continue
+        if idx == 0:
+            continue
+        if lower == "prayer":
+            last_prayer = idx
+        elif first_certificate is None and lower.startswith("certificate of"):
+            first_certificate = idx
+    if last_prayer is not None:
+        body_end = last_prayer
+    elif first_certificate is not None:
+        body_end = first_certificate
+    else:
+        body_end = len(paragraphs)
+    return body_start or 0, body_end
+
+
+# Table-of-contents line ending in a page number, and index-of-authorities entry
+TRAILING_PAGE_RE = re.compile(r'\d+$')
+INDEX_ENTRY_RE = re.compile(r'^[A-Z].*\d+(?:,\s*\d+)*$')
 
 
 def is_body_paragraph(text: str) -> bool:
@@ -1015,10 +1926,10 @@ def is_body_paragraph(text: str) -> bool:
     if len(text) < 20:
         return False
     # Skip TOC entries (contain tab-separated page numbers)
-    if "\t" in text and re.search(r'\d+$', text.strip()):
+    if "\t" in text and TRAILING_PAGE_RE.search(text.strip()):
         return False
     # Skip index entries (citations with page numbers)
-    if re.match(r'^[A-Z].*\d+(?:,\s*\d+)*$', text.strip()):
+    if INDEX_ENTRY_RE.match(text.strip()):
         return False
     # Skip certificate/prayer boilerplate markers
     lower = text.lower()
@@ -1031,9 +1942,20 @@ def is_body_paragraph(text: str) -> bool:
 # Report formatting
 # ---------------------------------------------------------------------------
 
-def format_report(results: list[dict]) -> str:
-    """Format results into a markdown report showing only items needing human attention."""
-    lines = ["# Line-by-Line Cite-Check Report\n"]
+# Assertion statuses that are errors in the brief, and those flagged in the
+# report for review (errors, sources the checker couldn't find, and sources
+# too large to send)
+ERROR_STATUSES = frozenset(("INACCURATE", "QUOTE_ERROR", "PIN_CITE_ERROR", "UNSUPPORTED"))
+REVIEW_STATUSES = ERROR_STATUSES | {"NEEDS_SOURCE", "NOT_CHECKED"}
+
+
+def _report_lines(results: list[dict]):
+    """Yield the markdown report's lines (see format_report), one at a time.
+
+    Totals are counted in a first pass so the summary can lead the report
+    without building the issue list in memory.
+    """
+    yield "# Line-by-Line Cite-Check Report\n"
 
     # Count totals
     total_assertions = 0
@@ -1049,41 +1971,113 @@ def format_report(results: list[dict]) -> str:
                 verified += 1
             elif status == "NOT_CHECKED":
                 not_checked += 1
-            elif status in ("INACCURATE", "QUOTE_ERROR", "PIN_CITE_ERROR", "UNSUPPORTED", "NEEDS_SOURCE"):
+            elif status in REVIEW_STATUSES:
                 errors += 1
 
-    lines.append(f"**Summary**: {len(results)} paragraphs checked, "
-                 f"{total_assertions} assertions found. "
-                 f"{verified} verified, {errors} flagged for review.\n")
+    not_checked_note = f", {not_checked} not checked" if not_checked else ""
+    yield (f"**Summary**: {len(results)} paragraphs checked, "
+           f"{total_assertions} assertions found. "
+           f"{verified} verified, {errors} flagged for review{not_checked_note}.\n")
 
-    if errors == 0:
-        lines.append("No issues found. All assertions verified.\n")
-        return "\n".join(lines)
+    if errors == 0 and not_checked == 0:
+        yield "No issues found. All assertions verified.\n"
+        return
 
     # Group errors by paragraph
-    lines.append("## Issues Requiring Attention\n")
+    yield "## Issues Requiring Attention\n"
     for r in results:
-        para_errors = [a for a in r.get("assertions", [])
-                       if a.get("status") in ("INACCURATE", "QUOTE_ERROR", "PIN_CITE_ERROR", "UNSUPPORTED", "NEEDS_SOURCE")]
-        if not para_errors:
-            continue
+        yield from _paragraph_report_lines(r)
+
+
+def _paragraph_report_lines(r: dict):
+    """Yield one paragraph's section of the report (nothing if it has no issues)."""
+    para_errors = [a for a in r.get("assertions", [])
+                   if a.get("status") in REVIEW_STATUSES]
+    if not para_errors:
+        return
+
+    page = r.get("page")
+    para_num = r["para_num"]
+    heading = f"Page {page}" if page else f"Paragraph {para_num}"
+    preview = r["text"][:200] + ("..." if len(r["text"]) > 200 else "")
+    yield f"### {heading}"
+    yield f"> {preview}\n"
 
-        page = r.get("page")
-        para_num = r["para_num"]
-        heading = f"Page {page}" if page else f"Paragraph {para_num}"
-        preview = r["text"][:200] + ("..." if len(r["text"]) > 200 else "")
-        lines.append(f"### {heading}")
-        lines.append(f"> {preview}\n")
+    for a in para_errors:
+        yield f"- **{a.get('status', '?')}**: {a.get('assertion', '')}"
+        yield f"  - Source: {a.get('source', '?')}"
+        if a.get("detail"):
+            yield f"  - {a['detail']}"
 
-        for a in para_errors:
-            lines.append(f"- **{a.get('status', '?')}**: {a.get('assertion', '')}")
-            lines.append(f"  - Source: {a.get('source', '?')}")
-            if a.get("detail"):
-                lines.append(f"  - {a['detail']}")
+    yield ""
 
-        lines.append("")
 
-    return "\n".join(lines)
+def format_report(results: list[dict]) -> str:
+    """Format results into a markdown report showing only items needing human attention."""
+    return "\n".join(_report_lines(results))
+
+
+def write_report(results: list[dict], output_path: Path, footer: str):
+    """Write format_report(results) + footer to output_path line by line."""
+    with open(output_path, "w", encoding="utf-8") as f:
+        separator = ""
+        for line in _report_lines(results):
+            f.write(separator)
+            f.write(line)
+            separator = "\n"
+        f.write(footer)
+
+
+def read_partial_results(partial_path: Path) -> list[dict]:
+    """Read the paragraph results from a .partial.jsonl file, one per line.
+
+    A line that doesn't decode (cut short by an interrupted run) is skipped.
+    """
+    results = []
+    with open(partial_path) as f:
+        for line in f:
+            try:
+                results.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # line cut short by an interrupted run
+    return results
+
+
+def resume_results(previous: list[dict], cite_paragraphs: list[tuple[int, int, str]],
+                   body_scans: list[list[tuple[str, tuple]]],
+                   page_index: PageIndex | None) -> list[dict]:
+    """Reuse previous results for the paragraphs still in the brief.
+
+    Results are matched by paragraph text, so paragraphs that only moved
+    (edits elsewhere in the brief shift the numbering) are reused and
+    edited ones are re-checked. A paragraph with an Id. cite depends on
+    what precedes it, so it must also be at the same position. Like the
+    response cache, a result with no assertions (its calls failed or
+    returned nothing) is never reused, so that paragraph is checked again.
+
+    cite_paragraphs: (body index, paragraph number, text) for each paragraph to check
+    body_scans: scan_citations tokens for each body paragraph, by body index
+    """
+    by_text = {}
+    for r in previous:
+        if r.get("assertions"):
+            by_text.setdefault(r["text"], r)
+    same_place = {(r["para_num"], r["text"]) for r in previous}
+    results = []
+    for i, para_idx, text in cite_paragraphs:
+        r = by_text.get(text)
+        if r is None:
+            continue
+        if ((para_idx, text) not in same_place
+                and any(kind == "id" for kind, _ in body_scans[i])):
+            continue
+        results.append({
+            "para_num": para_idx,
+            "page": find_page_number(text, page_index),
+            "text": text,
+            "assertions": [dict(a) for a in r["assertions"]],
+        })
+    return results
 
 
 # ---------------------------------------------------------------------------
@@ -1098,13 +2092,31 @@ def main():
     parser.add_argument("--model", default="opus",
                         help="Claude model to use (default: opus)")
     parser.add_argument("--start", type=int, default=0,
-                        help="Start from this paragraph index (for resuming)")
+                        help="Start from this paragraph index")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Neither read nor save cached Claude responses or page maps")
+    parser.add_argument("--no-resume", action="store_true",
+                        help="Ignore results saved by an interrupted run and check every paragraph")
     parser.add_argument("--limit", type=int, default=0,
                         help="Process only this many paragraphs (0 = all)")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Paragraph groups checked at once (default: 4)")
+    parser.add_argument("--group-paragraphs", type=int, default=3,
+                        help="Check up to this many consecutive paragraphs citing the same "
+                             "or overlapping sources in one prompt (default: 3; 1 = never group)")
+    parser.add_argument("--max-claude-calls", type=int, default=MAX_CLAUDE_CALLS,
+                        help=f"Claude calls running at once across all paragraphs (default: {MAX_CLAUDE_CALLS})")
+    parser.add_argument("--string-cite-excerpts", action="store_true",
+                        help="Send only the opening of cases the paragraph neither quotes "
+                             "nor describes; their propositions are reported as not checked")
+    parser.add_argument("--named-case-excerpts", action="store_true",
+                        help="Also send the opening of cases a paragraph names without citing, "
+                             "when exactly one authority filename names both parties")
     parser.add_argument("--dry-run", action="store_true",
                         help="Show which paragraphs would be checked, without calling Claude")
     parser.add_argument("--from-json", type=Path, default=None,
-                        help="Regenerate report from a saved JSON results file (no Claude calls)")
+                        help="Regenerate report from a saved JSON results file, or the "
+                             ".partial.jsonl left by an interrupted run (no Claude calls)")
     args = parser.parse_args()
 
     if not args.from_json and not args.docx:
@@ -1116,11 +2128,14 @@ def main():
         if not json_path.exists():
             print(f"File not found: {json_path}", file=sys.stderr)
             sys.exit(1)
-        results = json.loads(json_path.read_text())
+        if json_path.suffix == ".jsonl":
+            results = read_partial_results(json_path)
+            results.sort(key=lambda r: r["para_num"])
+        else:
+            results = json.loads(json_path.read_text())
         output_path = args.output or json_path.with_name("CITECHECK_LINEBY.md")
-        report = format_report(results)
-        report += f"\n---\n*Regenerated from {json_path.name}*\n"
-        output_path.write_text(report)
+        write_report(results, output_path,
+                     f"\n---\n*Regenerated from {json_path.name}*\n")
         print(f"Report regenerated: {output_path}")
         return
 
@@ -1135,6 +2150,22 @@ def main():
     print(f"Brief: {docx_path.name}")
     print(f"Project dir: {project_dir}")
 
+    # Open the response cache (shared by every Claude call this run)
+    global response_cache, claude_slots
+    if not args.no_cache:
+        response_cache = ResponseCache(project_dir / ".citecheck_cache.sqlite")
+        print(f"Response cache: {response_cache.path.name} ({len(response_cache)} entries)")
+    claude_slots = threading.BoundedSemaphore(max(1, args.max_claude_calls))
+
+    # Start the DOCX → PDF conversion now; it runs in LibreOffice while
+    # the sources and paragraphs below are loaded and checked. The early
+    # exits below set page_map_stop so exiting doesn't wait for it.
+    page_map_stop = threading.Event()
+    page_map_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pagemap")
+    page_map_future = page_map_pool.submit(load_page_map, docx_path, not args.no_cache,
+                                           page_map_stop)
+    page_map_pool.shutdown(wait=False)
+
     # Load authorities
     auth_dir = project_dir / "authorities"
     if auth_dir.exists():
@@ -1163,14 +2194,15 @@ def main():
 
     # Load State's Brief
     state_brief_text = None
-    for f in sorted(project_dir.glob("*.txt")):
+    txt_files = sorted(project_dir.glob("*.txt"))
+    for f in txt_files:
         if "state" in f.name.lower() and "brief" in f.name.lower() and "notice" not in f.name.lower():
             state_brief_text = f.read_text(errors="replace")
             print(f"Loaded State's Brief: {f.name} ({len(state_brief_text):,} chars)")
             break
     if not state_brief_text:
         # Also check for the State's brief PDF text
-        for f in sorted(project_dir.glob("*.txt")):
+        for f in txt_files:
             if "state" in f.name.lower() and "notice" not in f.name.lower():
                 state_brief_text = f.read_text(errors="replace")
                 print(f"Loaded State's filing: {f.name} ({len(state_brief_text):,} chars)")
@@ -1183,87 +2215,69 @@ def main():
     paragraphs = extract_paragraphs(docx_path)
     print(f"Extracted {len(paragraphs)} non-empty paragraphs")
 
-    # Build page map (DOCX → PDF → page texts)
-    print("Converting to PDF for page mapping...")
-    page_texts = build_page_map(docx_path)
-    if page_texts:
-        print(f"Page map: {len(page_texts)} pages")
-    else:
-        print("  Warning: page mapping unavailable, using paragraph numbers")
-
     # Filter to body paragraphs with citations
-    # Skip front matter (TOC, index of authorities) — look for "Argument" or "Summary"
-    body_start = 0
-    for idx, (para_idx, text) in enumerate(paragraphs):
-        lower = text.strip().lower()
-        if lower in ("argument", "summary of reply argument", "summary of argument",
-                      "summary of the argument"):
-            body_start = idx
-            break
-
-    # Find where body ends (Prayer, Certificate, etc.)
-    body_end = len(paragraphs)
-    for idx in range(len(paragraphs) - 1, body_start, -1):
-        lower = paragraphs[idx][1].strip().lower()
-        if lower.startswith("certificate of") or lower == "prayer":
-            body_end = idx
-            # keep going backwards to find the earliest ending marker
-        if lower in ("prayer",):
-            body_end = idx
-            break
-
+    body_start, body_end = find_body_bounds(paragraphs)
     body_paragraphs = paragraphs[body_start:body_end]
     print(f"Body paragraphs: {len(body_paragraphs)} (indices {body_start}–{body_end})")
 
+    # Tokenize each body paragraph once; the filter, pre-check, dry run
+    # and source gathering below all reuse these scans
+    body_scans = [scan_citations(_clean_for_cite_match(text)) for _, text in body_paragraphs]
+
     # Filter to paragraphs that contain citations
     cite_paragraphs = [(i, para_idx, text) for i, (para_idx, text) in enumerate(body_paragraphs)
-                       if has_citation(text)]
+                       if has_citation(text, body_scans[i])]
     print(f"Paragraphs with citations: {len(cite_paragraphs)}")
 
     if args.dry_run:
         print("\n--- DRY RUN ---")
         for i, para_idx, text in cite_paragraphs:
-            case_cites = extract_case_cites(text)
-            rr_refs = extract_record_refs(text)
-            sb_refs = extract_state_brief_refs(text)
+            case_cites = _case_cites_from_scan(body_scans[i])
+            rr_refs = _record_refs_from_scan(body_scans[i])
+            sb_refs = _state_brief_refs_from_scan(body_scans[i])
             cite_summary = []
             for c in case_cites:
                 cite_summary.append(f"{c['case_name']}, {c['volume']} {c['reporter']} {c['page']}")
-            for r in rr_refs:
-                if r["type"] == "rr":
-                    cite_summary.append(f"RR{r['volume']}:{r['page']}")
-                elif r["type"] == "cr":
-                    cite_summary.append(f"CR:{r['page']}")
+            for volume, page in rr_refs.rr:
+                cite_summary.append(f"RR{volume}:{page}")
+            for page in rr_refs.cr:
+                cite_summary.append(f"CR:{page}")
             for s in sb_refs:
                 cite_summary.append(f"State's Br. at {s['pages']}")
             print(f"\n[{para_idx}] {text[:120]}...")
             print(f"   Citations: {'; '.join(cite_summary)}")
+        page_map_stop.set()
         return
 
     # Pre-check: verify all cited authorities exist in the authorities folder
     all_cited = {}  # {(vol, reporter, page): case_name}
-    for _, text in body_paragraphs:
-        for cite in extract_case_cites(text):
+    for (_, text), tokens in zip(body_paragraphs, body_scans):
+        for cite in _case_cites_from_scan(tokens):
             key = (cite["volume"], cite["reporter"], cite["page"])
             if key not in all_cited:
                 all_cited[key] = cite["case_name"]
         # Also check bare reporter cites
         clean = _clean_for_cite_match(text)
+        if not (_has_digit(clean) and REPORTER_CITE_GATE_RE.search(clean)):
+            continue
         for m in BARE_REPORTER_RE.finditer(clean):
             key = (m.group(1), m.group(2), m.group(3))
             if key not in all_cited:
                 all_cited[key] = ""
 
+    # Load the cited authorities found in the cite index in parallel; the
+    # lookups below (and later source gathering) then read from memory
+    if isinstance(auth_files, LazyAuthorities):
+        auth_files.prefetch({cite_index[norm] for norm in
+                             (_norm_cite(f"{vol} {rep} {pg}") for vol, rep, pg in all_cited)
+                             if norm in cite_index})
+
+    # all_cited is keyed by (volume, reporter, page), so each citation
+    # is looked up (and reported) once
     missing = []
-    seen_missing = set()
     for (vol, rep, pg), name in all_cited.items():
         match = find_authority(name, vol, rep, pg, auth_files, cite_index=cite_index)
         if not match:
-            # Deduplicate by vol/reporter/page
-            dedup_key = (vol, rep, pg)
-            if dedup_key in seen_missing:
-                continue
-            seen_missing.add(dedup_key)
             label = f"{name}, {vol} {rep} {pg}" if name else f"{vol} {rep} {pg}"
             missing.append(label)
 
@@ -1272,6 +2286,7 @@ def main():
         for m in sorted(missing):
             print(f"  - {m}")
         print("\nAdd the missing authorities and re-run. Stopping.")
+        page_map_stop.set()
         sys.exit(1)
 
     print(f"Authority check: all {len(all_cited)} cited authorities found")
@@ -1281,99 +2296,200 @@ def main():
     if id_map:
         print(f"Id. map: resolved {len(id_map)} Id. references")
 
+    # Wait for the page map (DOCX → PDF → page texts) started above
+    page_texts, page_map_status, page_map_warnings = page_map_future.result()
+    for warning in page_map_warnings:
+        print(f"  Warning: {warning}", file=sys.stderr)
+    if page_texts:
+        print(f"Page map: {len(page_texts)} pages ({page_map_status})")
+    else:
+        print("  Warning: page mapping unavailable, using paragraph numbers")
+    page_index = build_page_index(page_texts)
+
     # Process paragraphs
     results = []
     last_case = None
-    start_time = time.time()
-
-    # Load any existing partial results for resuming
-    partial_path = output_path.with_suffix(".partial.json")
-    if args.start > 0 and partial_path.exists():
+    start_time = time.perf_counter()
+
+    # Load any existing partial results for resuming. The partial file is
+    # JSON Lines, one paragraph result per line, appended as each finishes.
+    partial_path = output_path.with_suffix(".partial.jsonl")
+    if not args.no_resume and partial_path.exists():
+        results = resume_results(read_partial_results(partial_path), cite_paragraphs,
+                                 body_scans, page_index)
+        print(f"Resumed from {len(results)} previously checked paragraphs")
+    # Partial lines are read back only by this script, so no padding
+    partial_json = json.JSONEncoder(separators=(",", ":")).encode
+    resumed = {r["para_num"] for r in results}
+    # Rewritten once so a cut-short last line is dropped, not appended to.
+    # The new file (resumed results, then each new one) is built beside
+    # the old and replaces it only once it holds a new result, so a crash
+    # or a --no-resume stopped before then leaves the old progress intact.
+    partial_tmp = partial_path.with_suffix(".jsonl.tmp")
+    partial_fh = open(partial_tmp, "w")
+    partial_replaced = False
+    for result in results:
+        partial_fh.write(partial_json(result) + "\n")
+
+    # Issues across all results (resumed and new), tallied as results arrive
+    error_count = sum(1 for r in results for a in r.get("assertions", [])
+                      if a.get("status") in REVIEW_STATUSES)
+
+    # Sources are gathered in brief order (Id. resolution carries the last
+    # cited case forward). Runs of consecutive paragraphs with identical
+    # sources are checked together, and the Claude calls for up to
+    # --concurrency groups then run at once.
+    def finish(future):
+        nonlocal error_count, partial_replaced
+        members = pending.pop(future)
         try:
-            results = json.loads(partial_path.read_text())
-            print(f"Resumed from {len(results)} previously checked paragraphs")
-        except Exception:
-            pass
+            by_para = future.result()
+        except Exception as e:
+            print(f"  {', '.join(loc for _, _, loc, _ in members)}: FAILED — {e}",
+                  file=sys.stderr)
+            by_para = {}
+
+        saved = False
+        for para_idx, page_num, loc, text in members:
+            assertions = by_para.get(para_idx, [])
+            n_verified = n_errors = n_review = 0
+            for a in assertions:
+                status = a.get("status")
+                if status == "VERIFIED":
+                    n_verified += 1
+                elif status in ERROR_STATUSES:
+                    n_errors += 1
+                elif status in REVIEW_STATUSES:
+                    n_review += 1
+            error_count += n_errors + n_review
+
+            status_str = f"{n_verified} verified"
+            if n_errors:
+                status_str += f", {n_errors} ERRORS"
+            print(f"  {loc} result [{len(results) + 1}/{total_to_check}]: "
+                  f"{len(assertions)} assertions ({status_str})")
+
+            result = {
+                "para_num": para_idx,
+                "page": page_num,
+                "text": text,
+                "assertions": assertions,
+            }
+            results.append(result)
+
+            # Save partial results after each paragraph that was checked
+            if assertions:
+                partial_fh.write(partial_json(result) + "\n")
+                saved = True
+        partial_fh.flush()
+        if saved and not partial_replaced:
+            os.replace(partial_tmp, partial_path)
+            partial_replaced = True
+
+    def submit(group, members, sources, member_sources):
+        # Call Claude — one prompt per batch of sources, then a second
+        # pass for any NEEDS_SOURCE assertions
+        while len(pending) >= max(1, args.concurrency):
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                finish(future)
+        future = executor.submit(check_paragraph_group, group, sources, auth_files,
+                                 model=args.model, cite_index=cite_index,
+                                 member_sources=member_sources)
+        pending[future] = members
+
+    # Results expected by the end of this run (for the progress count)
+    total_to_check = len(results) + sum(1 for _, para_idx, _ in cite_paragraphs[args.start:]
+                                        if para_idx not in resumed)
+    if args.limit:
+        total_to_check = min(total_to_check, len(results) + args.limit)
 
     processed_count = 0
-    for seq, (i, para_idx, text) in enumerate(cite_paragraphs):
-        if seq < args.start:
-            continue
-        if args.limit and processed_count >= args.limit:
-            print(f"\nReached --limit {args.limit}, stopping.")
-            break
-
-        elapsed = time.time() - start_time
-        page_num = find_page_number(text, page_texts)
-        loc = f"p. {page_num}" if page_num else f"para {para_idx}"
-        print(f"\n[{seq+1}/{len(cite_paragraphs)}] {loc} ({elapsed:.0f}s elapsed)")
-        print(f"  {text[:100]}...")
-
-        # Gather sources (list of (label, text) tuples — one per source)
-        id_target = id_map.get(para_idx)
-        sources, last_case = gather_sources(text, auth_files, record_index,
-                                            state_brief_text, last_case,
-                                            cite_index=cite_index,
-                                            id_target=id_target)
-
-        total_kb = sum(len(t) for _, t in sources) / 1024
-        source_labels = [label[:40] for label, _ in sources]
-        print(f"  Sources ({len(sources)}): {', '.join(source_labels)} [{total_kb:.0f} KB total]")
-
-        # Call Claude — one prompt per source, in parallel
-        assertions = verify_paragraph(para_idx, text, sources, model=args.model,
-                                      page_num=page_num)
-
-        # Second pass: resolve any NEEDS_SOURCE assertions
-        assertions = resolve_needs_source(para_idx, text, assertions, auth_files,
-                                          model=args.model, page_num=page_num,
-                                          cite_index=cite_index)
-
-        n_verified = sum(1 for a in assertions if a.get("status") == "VERIFIED")
-        n_errors = sum(1 for a in assertions if a.get("status") in
-                       ("INACCURATE", "QUOTE_ERROR", "PIN_CITE_ERROR", "UNSUPPORTED"))
-
-        status_str = f"{n_verified} verified"
-        if n_errors:
-            status_str += f", {n_errors} ERRORS"
-        print(f"  Result: {len(assertions)} assertions ({status_str})")
-
-        results.append({
-            "para_num": para_idx,
-            "page": page_num,
-            "text": text,
-            "assertions": assertions,
-        })
+    pending = {}  # future -> [(para_idx, page_num, loc, text), ...]
+    group, members, group_sources = [], [], []
+    member_sources = {}  # para_idx -> that paragraph's own sources, for the open group
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+        for seq, (i, para_idx, text) in enumerate(cite_paragraphs):
+            if seq < args.start:
+                continue
+            if args.limit and processed_count >= args.limit:
+                print(f"\nReached --limit {args.limit}, stopping.")
+                break
+            if para_idx in resumed:
+                # Already checked; gather sources only to carry the last
+                # cited case forward for later Id. cites
+                _, last_case = gather_sources(text, auth_files, record_index,
+                                              state_brief_text, last_case,
+                                              cite_index=cite_index,
+                                              id_target=id_map.get(para_idx),
+                                              tokens=body_scans[i])
+                continue
 
-        # Save partial results after each paragraph
-        partial_path.write_text(json.dumps(results, indent=2))
-        processed_count += 1
+            elapsed = time.perf_counter() - start_time
+            page_num = find_page_number(text, page_index)
+            loc = f"p. {page_num}" if page_num else f"para {para_idx}"
+            print(f"\n[{seq+1}/{len(cite_paragraphs)}] {loc} ({elapsed:.0f}s elapsed)")
+            print(f"  {text[:100]}...")
+
+            # Gather sources (list of (label, text) tuples — one per source)
+            id_target = id_map.get(para_idx)
+            sources, last_case = gather_sources(text, auth_files, record_index,
+                                                state_brief_text, last_case,
+                                                cite_index=cite_index,
+                                                id_target=id_target,
+                                                tokens=body_scans[i],
+                                                excerpt_string_cites=args.string_cite_excerpts,
+                                                named_case_excerpts=args.named_case_excerpts)
+
+            total_kb = sum(len(t) for _, t in sources) / 1024
+            source_labels = [label[:40] for label, _ in sources]
+            print(f"  Sources ({len(sources)}): {', '.join(source_labels)} [{total_kb:.0f} KB total]")
+
+            # Sources the same as or overlapping the open group's: check
+            # this paragraph with it
+            merged = None
+            if group and sources and len(group) < args.group_paragraphs:
+                merged = merge_group_sources(group_sources, sources)
+            if merged is not None:
+                group_sources = merged
+                print(f"  (checked with {members[0][2]})")
+            elif group:
+                submit(group, members, group_sources, member_sources)
+                group, members, member_sources = [], [], {}
+            if not group:
+                group_sources = sources
+            group.append((para_idx, text, page_num))
+            members.append((para_idx, page_num, loc, text))
+            member_sources[para_idx] = sources
+            processed_count += 1
+
+        if group:
+            submit(group, members, group_sources, member_sources)
+        for future in as_completed(list(pending)):
+            finish(future)
+    partial_fh.close()
+
+    # Paragraphs finish out of order; report them in brief order
+    results.sort(key=lambda r: r["para_num"])
 
     # Generate report
-    total_time = time.time() - start_time
-    report = format_report(results)
-    report += f"\n---\n*Generated in {total_time:.0f}s using model: {args.model}*\n"
-
-    output_path.write_text(report)
+    total_time = time.perf_counter() - start_time
+    write_report(results, output_path,
+                 f"\n---\n*Generated in {total_time:.0f}s using model: {args.model}*\n")
     print(f"\nReport written to: {output_path}")
     print(f"Total time: {total_time:.0f}s")
 
     # Save final JSON results (for --from-json regeneration)
     json_path = output_path.with_suffix(".json")
-    json_path.write_text(json.dumps(results, indent=2))
+    with open(json_path, "w") as f:
+        json.dump(results, f, indent=2)
     print(f"JSON results saved to: {json_path}")
 
     # Clean up partial file
-    if partial_path.exists():
-        partial_path.unlink()
+    partial_path.unlink(missing_ok=True)
+    partial_tmp.unlink(missing_ok=True)
 
     # Print error summary
-    error_count = 0
-    for r in results:
-        for a in r.get("assertions", []):
-            if a.get("status") in ("INACCURATE", "QUOTE_ERROR", "PIN_CITE_ERROR", "UNSUPPORTED", "NEEDS_SOURCE"):
-                error_count += 1
-
     if error_count:
         print(f"\n{error_count} issue(s) found. Review the report for details.")
     else:
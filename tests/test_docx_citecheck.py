@@ -0,0 +1,458 @@
+"""Tests for docx_citecheck."""
+
+import threading
+import time
+
+import docx_citecheck as dc
+
+
+def test_untagged_group_reply_checks_each_paragraph_against_its_own_sources(monkeypatch):
+    bell = ("Bell v. Wolfish, 441 U.S. 520", "Bell opinion text")
+    cates = ("Cates v. Stroud, 976 F.3d 972", "Cates opinion text")
+    checked = {}
+
+    def untagged_group_reply(group, sources, model="opus"):
+        return None  # reply had no per-paragraph tags
+
+    def record_sources(para_num, paragraph, sources, model="opus", page_num=None):
+        checked[para_num] = [label for label, _ in sources]
+        return []
+
+    monkeypatch.setattr(dc, "verify_paragraph_group", untagged_group_reply)
+    monkeypatch.setattr(dc, "verify_paragraph", record_sources)
+
+    group = [(1, "See Bell v. Wolfish, 441 U.S. 520.", None),
+             (2, "See Cates v. Stroud, 976 F.3d 972.", None)]
+    dc.check_paragraph_group(group, [bell, cates], auth_files={},
+                             member_sources={1: [bell], 2: [cates]})
+
+    assert checked == {1: [bell[0]], 2: [cates[0]]}
+
+
+def test_cite_next_to_a_misquote_is_not_treated_as_a_string_cite():
+    para = ('Detainees "may never be searched at all." '
+            'Bell v. Wolfish, 441 U.S. 520 (1979).')
+    cite = {"case_name": "Bell v. Wolfish", "volume": "441", "reporter": "U.S."}
+    spans = [m.span() for m in dc.QUOTATION_RE.finditer(para)]
+
+    assert not dc._is_string_cite(para, cite, spans)
+    assert dc._is_string_cite("See Bell v. Wolfish, 441 U.S. 520.", cite, [])
+
+
+def test_extract_paragraphs_follows_the_office_document_relationship(tmp_path):
+    import zipfile
+
+    rels = ('<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Target="/word/document2.xml" Type="http://schemas.'
+            'openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+            '</Relationships>')
+    body = ('<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            '<w:body><w:p><w:r><w:t>First.</w:t></w:r></w:p><w:p/>'
+            '<w:p><w:r><w:t>Second.</w:t></w:r></w:p></w:body></w:document>')
+    docx = tmp_path / "brief.docx"
+    with zipfile.ZipFile(docx, "w") as z:
+        z.writestr("_rels/.rels", rels)
+        z.writestr("word/document2.xml", body)
+
+    assert dc.extract_paragraphs(docx) == [(0, "First."), (2, "Second.")]
+
+
+def test_only_case_names_without_a_cite_are_sent_as_named_excerpts():
+    auth = {"Bell v. Wolfish": "BELL", "Cates v. Stroud": "CATES"}
+    para = "Bell v. Wolfish held otherwise. Cates v. Stroud, 976 F.3d 972."
+
+    sources, _ = dc.gather_sources(para, auth, None, None, None)
+    assert [label for label, _ in sources] == ["Cates v. Stroud"]
+
+    sources, _ = dc.gather_sources(para, auth, None, None, None,
+                                   named_case_excerpts=True)
+    assert sources == [("Cates v. Stroud", "CATES"),
+                       ("Bell v. Wolfish (named in paragraph)",
+                        dc.NAMED_CASE_NOTE + "BELL")]
+
+
+def test_named_case_must_match_both_parties():
+    auth = {"Johnson v. Smith": "SMITH", "Johnson v. State (Tex. Crim. App. 2014)": "STATE"}
+
+    assert dc.find_authority_by_name("Johnson", "State", auth)[0] == (
+        "Johnson v. State (Tex. Crim. App. 2014)")
+    assert dc.find_authority_by_name("Johnson", "Jones", auth) is None
+    assert dc.find_authority_by_name("State", "State", auth) is None
+
+
+def test_named_westlaw_cite_replaces_an_earlier_bare_one():
+    para = "See 2014 WL 7131176, at *2. Haywood v. State, 2014 WL 7131176 (Tex. App. 2014)."
+
+    cites = dc._case_cites_from_scan(dc.scan_citations(dc._clean_for_cite_match(para)))
+
+    assert cites == [{"case_name": "Haywood v. State", "volume": "2014",
+                      "reporter": "WL", "page": "7131176", "type": "case"}]
+
+
+def test_response_cache_round_trips_and_persists(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = dc.ResponseCache(path)
+    key = dc.ResponseCache.key("prompt", "opus")
+    assertions = [{"assertion": "x", "status": "VERIFIED"}]
+
+    assert cache.get(key) is None
+    cache.put(key, assertions)
+    assert cache.get(key) == assertions
+    assert len(cache) == 1
+    cache.close()
+
+    reopened = dc.ResponseCache(path)
+    assert reopened.get(key) == assertions
+    assert reopened.get(dc.ResponseCache.key("prompt", "sonnet")) is None
+    reopened.close()
+
+
+def test_response_cache_treats_non_object_arrays_as_misses(tmp_path):
+    cache = dc.ResponseCache(tmp_path / "cache.sqlite")
+    cache.put("k", ["not", "assertions"])
+
+    assert cache.get("k") is None
+    cache.close()
+
+
+def _blocking_claude(monkeypatch, outcome):
+    """Replace _run_claude with one that blocks until released, then returns/raises outcome."""
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def run_claude(prompt, model, label, max_retries):
+        calls.append(prompt)
+        started.set()
+        release.wait(5)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return [dict(a) for a in outcome]
+
+    monkeypatch.setattr(dc, "response_cache", None)
+    monkeypatch.setattr(dc, "_run_calls", {})
+    monkeypatch.setattr(dc, "_run_claude", run_claude)
+    return calls, started, release
+
+
+def _call_twice_concurrently(started, release):
+    results = [None, None]
+
+    def call(i):
+        try:
+            results[i] = dc._call_claude("same prompt", "opus", f"call {i}")
+        except Exception as e:
+            results[i] = e
+
+    first = threading.Thread(target=call, args=(0,))
+    first.start()
+    assert started.wait(5)
+    second = threading.Thread(target=call, args=(1,))
+    second.start()
+    time.sleep(0.1)  # let the second call find the first one in flight
+    release.set()
+    first.join(5)
+    second.join(5)
+    return results
+
+
+def test_identical_in_flight_calls_share_one_claude_run(monkeypatch):
+    calls, started, release = _blocking_claude(monkeypatch, [{"status": "VERIFIED"}])
+
+    first, second = _call_twice_concurrently(started, release)
+
+    assert len(calls) == 1
+    assert first == second == [{"status": "VERIFIED"}]
+    assert first[0] is not second[0]  # each caller gets its own dicts
+
+
+def test_failed_in_flight_call_raises_for_every_caller(monkeypatch):
+    calls, started, release = _blocking_claude(monkeypatch, RuntimeError("boom"))
+
+    first, second = _call_twice_concurrently(started, release)
+
+    assert len(calls) == 1
+    assert isinstance(first, RuntimeError) and isinstance(second, RuntimeError)
+    assert dc._run_calls == {}  # dropped, so a later call retries
+
+
+def test_repeated_call_is_reused_for_the_rest_of_the_run(monkeypatch):
+    calls = []
+
+    def run_claude(prompt, model, label, max_retries):
+        calls.append(prompt)
+        return [{"status": "VERIFIED"}]
+
+    monkeypatch.setattr(dc, "response_cache", None)
+    monkeypatch.setattr(dc, "_run_calls", {})
+    monkeypatch.setattr(dc, "_run_claude", run_claude)
+
+    first = dc._call_claude("same prompt", "opus", "first")
+    first[0]["status"] = "CHANGED"  # callers may modify what they get back
+    second = dc._call_claude("same prompt", "opus", "second")
+
+    assert len(calls) == 1
+    assert second == [{"status": "VERIFIED"}]
+
+
+def test_empty_call_is_not_reused(monkeypatch):
+    calls = []
+
+    def run_claude(prompt, model, label, max_retries):
+        calls.append(prompt)
+        return []
+
+    monkeypatch.setattr(dc, "response_cache", None)
+    monkeypatch.setattr(dc, "_run_calls", {})
+    monkeypatch.setattr(dc, "_run_claude", run_claude)
+
+    dc._call_claude("same prompt", "opus", "first")
+    dc._call_claude("same prompt", "opus", "second")
+
+    assert len(calls) == 2
+
+
+def test_parse_json_array_strips_markdown_fences():
+    text = '```json\n[{"status": "VERIFIED"}]\n```'
+    assert dc.parse_json_array(text) == [{"status": "VERIFIED"}]
+
+
+def test_parse_json_array_finds_array_in_prose_with_brackets_in_strings():
+    text = ('Checked against [the record]:\n'
+            '[{"assertion": "At [PAGE 982] the court said ]", "status": "VERIFIED"}]\n'
+            'Done.')
+    assert dc.parse_json_array(text) == [
+        {"assertion": "At [PAGE 982] the court said ]", "status": "VERIFIED"}]
+
+
+def test_parse_json_array_skips_arrays_of_non_objects():
+    text = 'Sources: ["a.pdf", "b.pdf"]\n[{"status": "UNSUPPORTED"}]'
+    assert dc.parse_json_array(text) == [{"status": "UNSUPPORTED"}]
+    assert dc.parse_json_array('[["nested"]]') == []
+    assert dc.parse_json_array("no array here") == []
+
+
+def test_batch_sources_packs_first_fit(monkeypatch):
+    monkeypatch.setattr(dc, "MAX_PROMPT_SOURCE_CHARS", 100)
+    monkeypatch.setattr(dc, "MAX_SOURCES_PER_PROMPT", 3)
+    sources = [("a", "x" * 40), ("big", "x" * 90), ("b", "x" * 40),
+               ("c", "x" * 10), ("d", "x" * 5), ("e", "x" * 5)]
+
+    batches = dc._batch_sources(sources)
+
+    assert [[label for label, _ in batch] for batch in batches] == [
+        ["a", "b", "c"], ["big", "d", "e"]]
+
+
+def _verify_cache_key(monkeypatch, paragraph, **kwargs):
+    keys = []
+
+    def call_claude(prompt, model, label, max_retries=3, cache_key=None):
+        keys.append(cache_key)
+        return []
+
+    monkeypatch.setattr(dc, "_call_claude", call_claude)
+    dc.verify_paragraph(3, paragraph, [("Smith v. Jones", "The court held X.")], **kwargs)
+    return keys[0]
+
+
+def test_verify_cache_key_ignores_location_and_spacing(monkeypatch):
+    key = _verify_cache_key(monkeypatch, "The court held X. Smith v. Jones.", page_num=4)
+
+    assert _verify_cache_key(monkeypatch, "The court held X. Smith v. Jones.", page_num=9) == key
+    assert _verify_cache_key(monkeypatch, "The court  held X.\nSmith v. Jones.",
+                             location="paragraph 3") == key
+    assert _verify_cache_key(monkeypatch, "The court held Y. Smith v. Jones.", page_num=4) != key
+
+
+def test_read_partial_results_skips_a_cut_short_line(tmp_path):
+    partial = tmp_path / "CITECHECK_LINEBY.partial.jsonl"
+    partial.write_text('{"para_num":1,"text":"A.","assertions":[]}\n'
+                       '{"para_num":2,"text":"B.","assertions":[]}\n'
+                       '{"para_num":3,"text":"C.","asser')
+
+    results = dc.read_partial_results(partial)
+
+    assert [r["para_num"] for r in results] == [1, 2]
+
+
+def _resume(previous, paragraphs):
+    cite_paragraphs = [(i, para_idx, text) for i, (para_idx, text) in enumerate(paragraphs)]
+    body_scans = [dc.scan_citations(dc._clean_for_cite_match(text)) for _, text in paragraphs]
+    return dc.resume_results(previous, cite_paragraphs, body_scans, None)
+
+
+def test_resume_matches_moved_paragraphs_by_text():
+    cited = "See Bell v. Wolfish, 441 U.S. 520, 530 (1979)."
+    previous = [{"para_num": 5, "text": cited, "assertions": [{"status": "VERIFIED"}]},
+                {"para_num": 6, "text": "Edited away.", "assertions": [{"status": "VERIFIED"}]}]
+
+    results = _resume(previous, [(2, "A new paragraph."), (6, cited)])
+
+    assert [(r["para_num"], r["text"]) for r in results] == [(6, cited)]
+    assert results[0]["assertions"] == [{"status": "VERIFIED"}]
+
+
+def test_resume_rechecks_moved_id_cites_and_empty_results():
+    id_cite = "Id. at 531."
+    empty = "See Cates v. Stroud, 976 F.3d 972 (5th Cir. 2020)."
+    previous = [{"para_num": 5, "text": id_cite, "assertions": [{"status": "VERIFIED"}]},
+                {"para_num": 6, "text": empty, "assertions": []}]
+
+    assert _resume(previous, [(5, id_cite), (6, empty)]) == [
+        {"para_num": 5, "page": None, "text": id_cite, "assertions": [{"status": "VERIFIED"}]}]
+    assert _resume(previous, [(6, id_cite), (7, empty)]) == []
+
+
+def _group_reply(monkeypatch, assertions):
+    prompts = []
+
+    def verify_paragraph(para_num, paragraph, sources, model="opus", page_num=None,
+                         location=None):
+        prompts.append((paragraph, location))
+        return [dict(a) for a in assertions]
+
+    monkeypatch.setattr(dc, "verify_paragraph", verify_paragraph)
+    group = [(4, "First.", 2), (5, "Second.", 3)]
+    return dc.verify_paragraph_group(group, [("Bell", "text")]), prompts
+
+
+def test_group_reply_is_split_by_paragraph_tag(monkeypatch):
+    not_sent = {"source": "Huge", "status": "NOT_CHECKED"}
+    by_para, prompts = _group_reply(monkeypatch, [
+        {"paragraph": 5, "status": "VERIFIED"},
+        {"paragraph": "4", "status": "UNSUPPORTED"},
+        not_sent,
+    ])
+
+    assert by_para == {4: [{"status": "UNSUPPORTED"}, not_sent],
+                       5: [{"status": "VERIFIED"}, not_sent]}
+    paragraph, location = prompts[0]
+    assert "[Paragraph 4] First.\n\n[Paragraph 5] Second." in paragraph
+    assert location == "pages 2–3"
+
+
+def test_group_reply_with_unknown_paragraph_tag_is_not_split(monkeypatch):
+    by_para, _ = _group_reply(monkeypatch, [{"paragraph": 4, "status": "VERIFIED"},
+                                            {"paragraph": 9, "status": "VERIFIED"}])
+    assert by_para is None
+
+
+def test_page_index_finds_the_page_a_paragraph_starts_on():
+    pages = ["Statement of the case.\nThe trial court\ndenied the motion to suppress.",
+             "The officer searched   the car without a warrant or consent.",
+             "Prayer"]
+    index = dc.build_page_index(pages)
+
+    assert dc.find_page_number("The trial court denied the motion to suppress.", index) == 1
+    assert dc.find_page_number("The officer searched the car without a warrant or consent. "
+                               "So the search was unlawful.", index) == 2
+    assert dc.find_page_number("Prayer", index) == 3
+    assert dc.find_page_number("Not in the brief at all, anywhere.", index) is None
+    assert dc.build_page_index([]) is None
+    assert dc.find_page_number("Prayer", None) is None
+
+
+def _paragraphs(*texts):
+    return list(enumerate(texts))
+
+
+def test_body_bounds_run_from_argument_heading_to_last_prayer():
+    paragraphs = _paragraphs("Table of Contents", "Prayer ....... 20", "Argument",
+                             "The search was unlawful.", "Prayer", "Relief follows.",
+                             "PRAYER", "Certificate of Service")
+    assert dc.find_body_bounds(paragraphs) == (2, 6)
+
+
+def test_body_bounds_ignore_endings_before_the_body_starts():
+    paragraphs = _paragraphs("Cover", "Prayer", "Certificate of Compliance",
+                             "Summary of the Argument", "The search was unlawful.",
+                             "Certificate of Service", "Certificate of Compliance")
+    assert dc.find_body_bounds(paragraphs) == (3, 5)
+
+
+def test_body_bounds_default_to_the_whole_document():
+    assert dc.find_body_bounds(_paragraphs("The search was unlawful.", "So reverse.")) == (0, 2)
+
+
+CITED_PARAGRAPH = (
+    "The stop was unlawful. Bell v. Wolfish, 441 U.S. 520, 530 (1979); see Cates v. Stroud, "
+    "976 F.3d 972 (5th Cir. 2020); Wolfish, 441 U.S. at 535; Smith v. State, 2014 WL 123456. "
+    "The officer admitted it. RR3:45; CR:112; SX4 1:02-1:30. Id. at 536. "
+    "The State's brief at 12-14 says otherwise."
+)
+
+
+def test_scan_citations_matches_each_record_pattern_on_its_own():
+    text = dc._clean_for_cite_match(CITED_PARAGRAPH)
+    tokens = dc.scan_citations(text)
+
+    for kind, pattern in [("rr", dc.RR_CITE_RE), ("cr", dc.CR_CITE_RE),
+                          ("exhibit", dc.EXHIBIT_RE), ("state_brief", dc.STATE_BRIEF_RE),
+                          ("id", dc.ID_CITE_RE)]:
+        expected = [m.groups() for m in pattern.finditer(text)]
+        assert expected, kind
+        assert [groups for k, groups in tokens if k == kind] == expected, kind
+
+
+def test_case_cites_cover_every_case_pattern_match_once():
+    text = dc._clean_for_cite_match(CITED_PARAGRAPH)
+    # The case patterns overlap (a short cite matches inside a full one), so
+    # the scan keeps the leftmost match; every cite is still found once
+    expected = {(m.group(2), m.group(3), m.group(4))
+                for pattern in (dc.CASE_CITE_RE, dc.SHORT_CITE_RE)
+                for m in pattern.finditer(text) if m.group(3) != "WL"}
+    expected |= {("WL", m.group(0).partition("WL")[2].strip())
+                 for m in dc.WL_CITE_RE.finditer(text)}
+
+    cites = dc.extract_case_cites(CITED_PARAGRAPH)
+
+    keys = [("WL", c["page"]) if c["reporter"] == "WL" else (c["volume"], c["reporter"], c["page"])
+            for c in cites]
+    assert sorted(keys) == sorted(expected)
+    assert [(c["case_name"], c["volume"], c["reporter"], c["page"]) for c in cites] == [
+        ("Bell v. Wolfish", "441", "U.S.", "520"),
+        ("Cates v. Stroud", "976", "F.3d", "972"),
+        ("Wolfish", "441", "U.S.", "535"),
+        ("Smith v. State", "2014", "WL", "123456"),
+    ]
+
+
+def test_record_and_brief_refs_are_built_from_the_scan():
+    refs = dc.extract_record_refs(CITED_PARAGRAPH)
+    assert (refs.rr, refs.cr, refs.exhibits) == ([(3, 45)], [112], [("4", "1:02-1:30")])
+    assert dc.extract_state_brief_refs(CITED_PARAGRAPH) == [
+        {"type": "state_brief", "pages": "12-14"}]
+
+
+def test_paragraph_joins_a_group_only_when_sources_overlap_and_fit(monkeypatch):
+    monkeypatch.setattr(dc, "MAX_SOURCES_PER_PROMPT", 3)
+    group = [("Bell", "bell text"), ("Cates", "cates text")]
+
+    assert dc.merge_group_sources(group, [("Bell (Id.)", "bell text"),
+                                          ("Cates", "cates text")]) is group
+    assert dc.merge_group_sources(group, [("Cates", "cates text"), ("Ruiz", "ruiz text")]) == [
+        ("Bell", "bell text"), ("Cates", "cates text"), ("Ruiz", "ruiz text")]
+    assert dc.merge_group_sources(group, [("Ruiz", "ruiz text")]) is None
+    assert dc.merge_group_sources(group, [("Bell", "bell text"), ("Ruiz", "ruiz text"),
+                                          ("Smith", "smith text")]) is None
+
+
+def test_small_sources_share_one_prompt_and_oversize_ones_are_not_sent(monkeypatch):
+    prompts = []
+
+    def call_claude(prompt, model, label, max_retries=3, cache_key=None):
+        prompts.append(prompt)
+        return [{"status": "VERIFIED"}]
+
+    monkeypatch.setattr(dc, "_call_claude", call_claude)
+    monkeypatch.setattr(dc, "MAX_SOURCE_CHARS", 50)
+    sources = [("Bell", "The court held X."), ("Huge", "x" * 51), ("Cates", "The court held Y.")]
+
+    assertions = dc.verify_paragraph(3, "X and Y. Bell; Cates.", sources)
+
+    assert len(prompts) == 1
+    assert "=== Bell ===" in prompts[0] and "=== Cates ===" in prompts[0]
+    assert "=== Huge ===" not in prompts[0]
+    assert [(a.get("source"), a["status"]) for a in assertions] == [
+        ("Huge", "NOT_CHECKED"), (None, "VERIFIED")]